@@ -3,76 +3,116 @@ import json
 from pathlib import Path
 from typing import Optional
 
+import streamlit as st
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover - orjson is optional
+    _loads = json.loads
+
+
+def _build_curriculum_index(curriculum: dict) -> None:
+    """Build lookup dicts for O(1) track/module/drill access."""
+    idx_track = {}
+    idx_module = {}
+    idx_drill = {}
+
+    for track in curriculum.get("tracks", []):
+        idx_track[track["id"]] = track
+        track_drills = 0
+        modules = track.get("modules", [])
+        for module in modules:
+            idx_module[module["id"]] = module
+            for drill in module.get("drills", []):
+                idx_drill[(module["id"], drill["id"])] = drill
+                track_drills += 1
+                # Per-question user filters are checked per render; make
+                # membership O(1) once instead of list scans per question
+                for question in drill.get("config", {}).get("questions", []):
+                    user_filter = question.get("user_filter")
+                    if isinstance(user_filter, list):
+                        question["user_filter"] = frozenset(user_filter)
+        track["_module_count"] = len(modules)
+        track["_drill_count"] = track_drills
+
+    # Flattened listings, precomputed so list_modules/list_drills_for_module
+    # are plain lookups instead of tree walks per call
+    modules_list = []
+    drills_by_module = {}
+    for track in curriculum.get("tracks", []):
+        for module in track.get("modules", []):
+            modules_list.append({
+                "track_id": track["id"],
+                "track_title": track["title"],
+                "module_id": module["id"],
+                "module_title": module["title"],
+                "module_summary": module.get("summary", ""),
+                "drill_count": len(module.get("drills", []))
+            })
+            drills_by_module[module["id"]] = [
+                {
+                    "drill_id": drill["id"],
+                    "drill_title": drill["title"],
+                    "drill_type": drill["drill_type"]
+                }
+                for drill in module.get("drills", [])
+            ]
+
+    curriculum["_idx_track"] = idx_track
+    curriculum["_idx_module"] = idx_module
+    curriculum["_idx_drill"] = idx_drill
+    curriculum["_modules_list"] = modules_list
+    curriculum["_drills_by_module"] = drills_by_module
+    curriculum["_stats"] = {
+        "tracks": len(idx_track),
+        "modules": len(idx_module),
+        "drills": len(idx_drill),
+    }
+
+
+@st.cache_data(show_spinner=False)
+def _load_cached(path_str: str, mtime_ns: int) -> dict:
+    """Parse curriculum JSON once per (path, mtime); reused across reruns."""
+    curriculum = _loads(Path(path_str).read_bytes())
+    _build_curriculum_index(curriculum)
+    return curriculum
+
 
 def load_curriculum(curriculum_path: Path) -> dict:
-    """Load curriculum from JSON file."""
+    """Load curriculum from JSON file.
+
+    Parsing is cached per (path, mtime), so pages may call this on every
+    rerun without re-reading the file; only a stat() is paid per call.
+    """
     if not curriculum_path.exists():
-        return {"tracks": []}
-    
-    with open(curriculum_path, "r", encoding="utf-8") as f:
-        return json.load(f)
+        empty = {"tracks": []}
+        _build_curriculum_index(empty)
+        return empty
+
+    return _load_cached(str(curriculum_path), curriculum_path.stat().st_mtime_ns)
 
 
 def get_track(curriculum: dict, track_id: str) -> Optional[dict]:
     """Get a track by ID."""
-    for track in curriculum.get("tracks", []):
-        if track["id"] == track_id:
-            return track
-    return None
+    return curriculum["_idx_track"].get(track_id)
 
 
 def get_module(curriculum: dict, module_id: str) -> Optional[dict]:
     """Get a module by ID (format: A1, B2, etc.)."""
-    track_id = module_id[0]
-    track = get_track(curriculum, track_id)
-    if not track:
-        return None
-    
-    for module in track.get("modules", []):
-        if module["id"] == module_id:
-            return module
-    return None
+    return curriculum["_idx_module"].get(module_id)
 
 
 def get_drill(curriculum: dict, module_id: str, drill_id: str) -> Optional[dict]:
     """Get a drill by module_id and drill_id."""
-    module = get_module(curriculum, module_id)
-    if not module:
-        return None
-    
-    for drill in module.get("drills", []):
-        if drill["id"] == drill_id:
-            return drill
-    return None
+    return curriculum["_idx_drill"].get((module_id, drill_id))
 
 
 def list_modules(curriculum: dict) -> list[dict]:
     """List all modules with track context."""
-    modules = []
-    for track in curriculum.get("tracks", []):
-        for module in track.get("modules", []):
-            modules.append({
-                "track_id": track["id"],
-                "track_title": track["title"],
-                "module_id": module["id"],
-                "module_title": module["title"],
-                "module_summary": module.get("summary", ""),
-                "drill_count": len(module.get("drills", []))
-            })
-    return modules
+    return curriculum["_modules_list"]
 
 
 def list_drills_for_module(curriculum: dict, module_id: str) -> list[dict]:
     """List all drills for a module."""
-    module = get_module(curriculum, module_id)
-    if not module:
-        return []
-    
-    drills = []
-    for drill in module.get("drills", []):
-        drills.append({
-            "drill_id": drill["id"],
-            "drill_title": drill["title"],
-            "drill_type": drill["drill_type"]
-        })
-    return drills
+    return curriculum["_drills_by_module"].get(module_id, [])
@@ -1,4 +1,5 @@
 """Drill engine: registry and dispatcher for drill types."""
+import operator
 import streamlit as st
 from typing import Callable, Optional
 
@@ -6,6 +7,16 @@ from typing import Callable, Optional
 # Drill registry: maps drill_type to render function
 DRILL_REGISTRY: dict[str, Callable] = {}
 
+# Operator dispatch table for coaching-rule conditions
+_OPS: dict[str, Callable] = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+
 
 def register_drill(drill_type: str):
     """Decorator to register a drill renderer."""
@@ -36,6 +47,17 @@ def render_drill(drill: dict, context: dict) -> tuple[Optional[dict], Optional[s
     return renderer(drill, context)
 
 
+def precompile_rules(rules: list[dict]) -> None:
+    """Bind each rule's comparator, field and value once instead of re-dispatching per evaluation."""
+    for rule in rules:
+        if "_cmp" in rule:
+            continue
+        condition = rule.get("condition", {})
+        rule["_cmp"] = _OPS.get(condition.get("operator"))
+        rule["_field"] = condition.get("field")
+        rule["_value"] = condition.get("value")
+
+
 def evaluate_coaching_rules(answers: dict, rules: list[dict], phase: str) -> tuple[str, str]:
     """
     Evaluate coaching rules based on answers.
@@ -50,42 +72,27 @@ def evaluate_coaching_rules(answers: dict, rules: list[dict], phase: str) -> tup
     """
     feedback_parts = []
     next_task_parts = []
-    
+
+    precompile_rules(rules)
+
+    # The {next_period} substitution depends only on the phase; compute it once
+    next_period_num = int(phase[1]) + 1 if phase.startswith("P") and len(phase) == 2 else ""
+    next_period_str = str(next_period_num) if next_period_num and next_period_num <= 3 else None
+
     for rule in rules:
-        condition = rule.get("condition", {})
-        field = condition.get("field")
-        operator = condition.get("operator")
-        value = condition.get("value")
-        
-        # Get answer value
-        answer_value = answers.get(field)
-        
-        # Evaluate condition
-        match = False
-        if operator == "==":
-            match = answer_value == value
-        elif operator == "!=":
-            match = answer_value != value
-        elif operator == "<=":
-            match = answer_value <= value
-        elif operator == ">=":
-            match = answer_value >= value
-        elif operator == "<":
-            match = answer_value < value
-        elif operator == ">":
-            match = answer_value > value
-        
-        if match:
+        cmp_func = rule["_cmp"]
+        if cmp_func is None:
+            continue
+
+        if cmp_func(answers.get(rule["_field"]), rule["_value"]):
             fb = rule.get("feedback", "")
             nt = rule.get("next_task", "")
-            
-            # Replace {next_period} placeholder
-            next_period_num = int(phase[1]) + 1 if phase.startswith("P") and len(phase) == 2 else ""
-            if next_period_num and next_period_num <= 3:
-                nt = nt.replace("{next_period}", str(next_period_num))
+
+            if next_period_str:
+                nt = nt.replace("{next_period}", next_period_str)
             else:
                 nt = nt.replace("P{next_period}", "nächste Session")
-            
+
             if fb:
                 feedback_parts.append(fb)
             if nt:
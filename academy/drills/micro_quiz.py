@@ -4,6 +4,19 @@ from academy.drill_engine import register_drill
 import time
 
 
+@st.fragment(run_every="1s")
+def _render_timer(k_start_time: str, time_limit: int):
+    """Auto-refreshing timer. Only this block reruns each second; the quiz form stays untouched."""
+    start_time = st.session_state.get(k_start_time)
+    if start_time is None:
+        return
+    remaining = max(0, time_limit - int(time.time() - start_time))
+    if remaining > 0:
+        st.progress(remaining / time_limit, text=f"⏱️ {remaining}s verbleibend")
+    else:
+        st.error("⏰ Zeit abgelaufen!")
+
+
 @register_drill("micro_quiz")
 def render_micro_quiz(drill: dict, context: dict):
     """
@@ -24,59 +37,63 @@ def render_micro_quiz(drill: dict, context: dict):
         st.warning("Keine Fragen konfiguriert.")
         return None, None, None
     
-    # Initialize session state for quiz
+    # Initialize session state for quiz; build the state keys once per render
     quiz_key = f"quiz_{drill.get('id', 'quiz')}_{phase}"
-    
-    if f"{quiz_key}_started" not in st.session_state:
-        st.session_state[f"{quiz_key}_started"] = False
-        st.session_state[f"{quiz_key}_answers"] = {}
-        st.session_state[f"{quiz_key}_start_time"] = None
+    k_started = f"{quiz_key}_started"
+    k_answers = f"{quiz_key}_answers"
+    k_start_time = f"{quiz_key}_start_time"
+    k_form = f"{quiz_key}_form"
+
+    if k_started not in st.session_state:
+        st.session_state[k_started] = False
+        st.session_state[k_answers] = {}
+        st.session_state[k_start_time] = None
     
     # Start button
-    if not st.session_state[f"{quiz_key}_started"]:
+    if not st.session_state[k_started]:
         if st.button("▶️ Quiz starten", key=f"{quiz_key}_start"):
-            st.session_state[f"{quiz_key}_started"] = True
-            st.session_state[f"{quiz_key}_start_time"] = time.time()
+            st.session_state[k_started] = True
+            st.session_state[k_start_time] = time.time()
             st.rerun()
         return None, None, None
     
     # Calculate elapsed time
-    elapsed = int(time.time() - st.session_state[f"{quiz_key}_start_time"])
+    elapsed = int(time.time() - st.session_state[k_start_time])
     remaining = max(0, time_limit - elapsed)
-    
-    # Show timer
+
+    # Show timer (auto-refreshes as a fragment without rerunning the form)
+    _render_timer(k_start_time, time_limit)
+
+    # Render questions; once time is up, skip rebuilding the form and
+    # evaluate directly from the answers already in session_state
+    answers = st.session_state[k_answers]
+    submitted = False
+
     if remaining > 0:
-        st.progress(remaining / time_limit, text=f"⏱️ {remaining}s verbleibend")
-    else:
-        st.error("⏰ Zeit abgelaufen!")
-    
-    # Render questions
-    answers = st.session_state[f"{quiz_key}_answers"]
-    
-    with st.form(key=f"{quiz_key}_form"):
-        for i, q in enumerate(questions):
-            q_id = q.get("id", f"q{i+1}")
-            question_text = q.get("question", "")
-            options = q.get("options", [])
-            
-            st.markdown(f"**{i+1}. {question_text}**")
-            answer = st.radio(
-                "Wähle eine Antwort:",
-                options,
-                key=f"{quiz_key}_{q_id}",
-                label_visibility="collapsed"
-            )
-            answers[q_id] = answer
-            st.divider()
-        
-        submitted = st.form_submit_button("✅ Quiz abschließen")
-    
+        with st.form(key=k_form):
+            for i, q in enumerate(questions):
+                q_id = q.get("id", f"q{i+1}")
+                question_text = q.get("question", "")
+                options = q.get("options", [])
+
+                st.markdown(f"**{i+1}. {question_text}**")
+                answer = st.radio(
+                    "Wähle eine Antwort:",
+                    options,
+                    key=f"{quiz_key}_{q_id}",
+                    label_visibility="collapsed"
+                )
+                answers[q_id] = answer
+                st.divider()
+
+            submitted = st.form_submit_button("✅ Quiz abschließen")
+
     if submitted or remaining == 0:
         # Evaluate answers
         correct_count = 0
         total_count = len(questions)
         
-        st.session_state[f"{quiz_key}_started"] = False  # Reset for next time
+        st.session_state[k_started] = False  # Reset for next time
         
         st.success(f"✅ Quiz abgeschlossen in {elapsed}s!")
         
@@ -3,6 +3,17 @@ import streamlit as st
 from academy.drill_engine import register_drill, evaluate_coaching_rules
 
 
+# Widget builders per question type, built once at module load
+_Q_BUILDERS = {
+    "radio": lambda q: st.radio(q.get("label"), q.get("options", []), key=q.get("id")),
+    "slider": lambda q: st.slider(
+        q.get("label"), q.get("min", 1), q.get("max", 5), q.get("default", 3), key=q.get("id")
+    ),
+    "text": lambda q: st.text_input(q.get("label"), max_chars=q.get("max_length", 120), key=q.get("id")),
+    "select": lambda q: st.selectbox(q.get("label"), q.get("options", []), key=q.get("id")),
+}
+
+
 @register_drill("period_checkin")
 def render_period_checkin(drill: dict, context: dict):
     """
@@ -32,42 +43,25 @@ def render_period_checkin(drill: dict, context: dict):
         for q in questions:
             q_id = q.get("id")
             q_type = q.get("type")
-            q_label = q.get("label")
             q_required = q.get("required", False)
             user_filter = q.get("user_filter", [])
-            
+
             # Skip question if user filter doesn't match
             if user_filter and user not in user_filter:
                 continue
-            
-            # Render based on type
-            if q_type == "radio":
-                options = q.get("options", [])
-                answer = st.radio(q_label, options, key=q_id)
-                answers[q_id] = answer
-            
-            elif q_type == "slider":
-                min_val = q.get("min", 1)
-                max_val = q.get("max", 5)
-                default_val = q.get("default", 3)
-                answer = st.slider(q_label, min_val, max_val, default_val, key=q_id)
-                answers[q_id] = answer
-            
-            elif q_type == "text":
-                max_length = q.get("max_length", 120)
-                answer = st.text_input(q_label, max_chars=max_length, key=q_id)
-                if answer:
-                    answers[q_id] = answer
-                elif not q_required:
-                    answers[q_id] = ""
-            
-            elif q_type == "select":
-                options = q.get("options", [])
-                answer = st.selectbox(q_label, options, key=q_id)
-                answers[q_id] = answer
-            
-            else:
+
+            # Render via the type dispatch table
+            builder = _Q_BUILDERS.get(q_type)
+            if builder is None:
                 st.warning(f"Unbekannter Question-Type: {q_type}")
+                continue
+
+            answer = builder(q)
+
+            # Required text questions without input are not recorded
+            if q_type == "text" and not answer and q_required:
+                continue
+            answers[q_id] = answer
         
         submitted = st.form_submit_button("💾 Speichern")
     
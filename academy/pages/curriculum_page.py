@@ -17,42 +17,40 @@ def render_curriculum_page(curriculum_path: Path):
         st.warning("Curriculum noch nicht geladen.")
         return
     
-    # Stats
-    total_modules = sum(len(track.get("modules", [])) for track in tracks)
-    total_drills = sum(
-        len(module.get("drills", []))
-        for track in tracks
-        for module in track.get("modules", [])
-    )
-    
+    # Stats (precomputed at index-build time)
+    stats = curriculum.get("_stats", {})
+
     col1, col2, col3 = st.columns(3)
     with col1:
-        st.metric("Tracks", len(tracks))
+        st.metric("Tracks", stats.get("tracks", len(tracks)))
     with col2:
-        st.metric("Module", total_modules)
+        st.metric("Module", stats.get("modules", 0))
     with col3:
-        st.metric("Drills", total_drills)
-    
+        st.metric("Drills", stats.get("drills", 0))
+
     st.divider()
-    
+
     # Filter
     filter_track = st.selectbox(
         "Track filtern",
         ["Alle"] + [f"{t['id']} – {t['title']}" for t in tracks],
         key="curriculum_track_filter"
     )
-    
+
+    # Resolve selection directly instead of filtering inside the render loop
+    if filter_track != "Alle":
+        selected = curriculum["_idx_track"].get(filter_track.split(" – ")[0])
+        display_tracks = [selected] if selected else []
+    else:
+        display_tracks = tracks
+
     # Display tracks
-    for track in tracks:
+    for track in display_tracks:
         track_id = track["id"]
         track_title = track["title"]
         track_goal = track.get("goal", "")
         modules = track.get("modules", [])
-        
-        # Apply filter
-        if filter_track != "Alle" and not filter_track.startswith(track_id):
-            continue
-        
+
         st.markdown(f"## Track {track_id}: {track_title}")
         st.caption(f"🎯 {track_goal}")
         
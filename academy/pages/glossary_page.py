@@ -3,6 +3,25 @@ import streamlit as st
 from pathlib import Path
 import json
 
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover - orjson is optional
+    _loads = json.loads
+
+
+@st.cache_data(show_spinner=False)
+def _load_wiki_cached(path_str: str, mtime_ns: int) -> tuple[dict, list[str], list[tuple[str, str]]]:
+    """Parse wiki JSON once per (path, mtime) and pre-build the search index.
+
+    Returns (data, sorted term names, [(lowercased name, name)]) so the
+    render path neither sorts nor lowercases per keystroke.
+    """
+    data = _loads(Path(path_str).read_bytes())
+    sorted_keys = sorted(data.keys())
+    lower_index = [(k.lower(), k) for k in sorted_keys]
+    return data, sorted_keys, lower_index
+
 
 def render_glossary_page(wiki_path: Path):
     """Render the glossary/wiki page."""
@@ -15,36 +34,37 @@ def render_glossary_page(wiki_path: Path):
         return
     
     try:
-        with open(wiki_path, "r", encoding="utf-8") as f:
-            wiki_data = json.load(f)
+        wiki_data, sorted_keys, lower_index = _load_wiki_cached(str(wiki_path), wiki_path.stat().st_mtime_ns)
     except Exception as e:
         st.error(f"Fehler beim Laden: {e}")
         return
-    
+
     if not wiki_data:
         st.info("Wiki ist leer.")
         return
-    
+
     # Search field
     search = st.text_input(
         "🔍 Begriff suchen",
         placeholder="z.B. Dreieck, Center, Forecheck, Box+1..."
     )
-    
-    # Filter terms
-    terms = list(wiki_data.keys())
+
+    # Filter terms via the precomputed lowercase index (already sorted)
     if search:
-        terms = [t for t in terms if search.lower() in t.lower()]
-    
+        sl = search.lower()
+        terms = [orig for lo, orig in lower_index if sl in lo]
+    else:
+        terms = sorted_keys
+
     if not terms:
         st.info("Keine Treffer.")
         return
-    
+
     st.caption(f"{len(terms)} Begriff(e) gefunden")
     st.divider()
-    
+
     # Display terms
-    for term_name in sorted(terms):
+    for term_name in terms:
         term = wiki_data[term_name]
         
         with st.expander(f"📖 {term_name}", expanded=False):
@@ -2,13 +2,27 @@
 import streamlit as st
 from pathlib import Path
 from academy.curriculum import load_curriculum
-from academy.sessions import list_sessions
+from academy.sessions_cache import cached_list_sessions
 from academy.renderers import (
     render_game_header, render_phase_badge,
     render_confidence_metric, render_helpfulness_metric
 )
 
 
+@st.cache_data(show_spinner=False)
+def _filter_options(dir_str: str, mtime_ns: int) -> tuple[tuple, tuple, tuple]:
+    """Derive the filter dropdown options once per sessions-directory snapshot."""
+    users = set()
+    modules = set()
+    states = set()
+    for s in cached_list_sessions(Path(dir_str)):
+        users.add(s.get("user", "unknown"))
+        if s.get("module_id"):
+            modules.add(s["module_id"])
+        states.add(s.get("state", ""))
+    return tuple(sorted(users)), tuple(sorted(modules)), tuple(sorted(states))
+
+
 def render_history_page(
     curriculum_path: Path,
     sessions_dir: Path,
@@ -20,35 +34,34 @@ def render_history_page(
     st.caption("Vergangene Sessions durchsuchen")
     
     curriculum = load_curriculum(curriculum_path)
-    all_sessions = list_sessions(sessions_dir)
+    all_sessions = cached_list_sessions(sessions_dir)
     
     if not all_sessions:
         st.info("Noch keine Sessions vorhanden.")
         return
     
-    # Filter options
+    # Filter options: cached per directory snapshot
+    mtime_ns = sessions_dir.stat().st_mtime_ns if sessions_dir.exists() else 0
+    users, modules, states = _filter_options(str(sessions_dir), mtime_ns)
+
     col1, col2, col3 = st.columns(3)
-    
+
     with col1:
-        users = list(set(s.get("user", "unknown") for s in all_sessions))
-        select_user = st.selectbox("User", ["alle"] + sorted(users))
-    
+        select_user = st.selectbox("User", ["alle"] + list(users))
+
     with col2:
-        modules = list(set(s.get("module_id", "") for s in all_sessions if s.get("module_id")))
-        select_module = st.selectbox("Modul", ["alle"] + sorted(modules))
-    
+        select_module = st.selectbox("Modul", ["alle"] + list(modules))
+
     with col3:
-        states = list(set(s.get("state", "") for s in all_sessions))
-        select_state = st.selectbox("Status", ["alle"] + sorted(states))
-    
-    # Apply filters
-    filtered_sessions = all_sessions
-    if select_user != "alle":
-        filtered_sessions = [s for s in filtered_sessions if s.get("user") == select_user]
-    if select_module != "alle":
-        filtered_sessions = [s for s in filtered_sessions if s.get("module_id") == select_module]
-    if select_state != "alle":
-        filtered_sessions = [s for s in filtered_sessions if s.get("state") == select_state]
+        select_state = st.selectbox("Status", ["alle"] + list(states))
+
+    # Apply all filters in one pass
+    filtered_sessions = [
+        s for s in all_sessions
+        if (select_user == "alle" or s.get("user") == select_user)
+        and (select_module == "alle" or s.get("module_id") == select_module)
+        and (select_state == "alle" or s.get("state") == select_state)
+    ]
     
     st.caption(f"{len(filtered_sessions)} Session(s) gefunden")
     
@@ -57,25 +70,66 @@ def render_history_page(
         return
     
     st.divider()
-    
-    # Display sessions
-    for session in filtered_sessions:
+
+    # Paginate: render only one page of sessions per rerun
+    page_size = 20
+    total_pages = (len(filtered_sessions) + page_size - 1) // page_size
+    page = st.session_state.setdefault("history_page", 0)
+    page = min(page, total_pages - 1)  # Clamp when filters shrink the list
+    start = page * page_size
+
+    for session in filtered_sessions[start:start + page_size]:
         render_session_detail(session, curriculum, team_logo_callback)
         st.divider()
 
+    if total_pages > 1:
+        col_prev, col_info, col_next = st.columns([1, 2, 1])
+        with col_prev:
+            if st.button("⬅️ Zurück", disabled=page == 0, use_container_width=True):
+                st.session_state["history_page"] = page - 1
+                st.rerun()
+        with col_info:
+            st.caption(f"Seite {page + 1} von {total_pages}")
+        with col_next:
+            if st.button("Weiter ➡️", disabled=page >= total_pages - 1, use_container_width=True):
+                st.session_state["history_page"] = page + 1
+                st.rerun()
+
 
 def render_session_detail(session: dict, curriculum: dict, team_logo_callback=None):
-    """Render a single session in detail."""
+    """Render a single session in detail. The body is only built once opened."""
     game = session.get("game", {})
     module_id = session.get("module_id", "")
     drill_id = session.get("drill_id", "")
     user = session.get("user", "unknown")
     state = session.get("state", "unknown")
-    
-    # Container with border - use expander to show/hide details
+    session_id = session.get("session_id", "")
+
     session_title = f"{game.get('date', 'Unbekannt')} | {game.get('home', '')} vs {game.get('away', '')} | {module_id}"
-    
-    with st.expander(f"🎯 {session_title}", expanded=False):
+
+    # A collapsed st.expander would still execute its whole body per rerun.
+    # Use an explicit toggle so the detail tree is only built when opened.
+    open_key = f"open_{session_id}"
+    is_open = st.session_state.get(open_key, False)
+
+    with st.container(border=True):
+        col_title, col_toggle = st.columns([4, 1])
+        with col_title:
+            st.markdown(f"**🎯 {session_title}**")
+        with col_toggle:
+            label = "➖ Zuklappen" if is_open else "➕ Anzeigen"
+            if st.button(label, key=f"toggle_{session_id}", use_container_width=True):
+                st.session_state[open_key] = not is_open
+                st.rerun()
+
+        if not is_open:
+            return
+
+        # Bind session sub-dicts once for the render below
+        pre = session.get("pre") or {}
+        checkins = session.get("checkins") or ()
+        post = session.get("post") or {}
+
         # Header
         render_game_header(game, team_logo_callback)
         
@@ -84,7 +138,6 @@ def render_session_detail(session: dict, curriculum: dict, team_logo_callback=No
         st.divider()
         
         # PRE data
-        pre = session.get("pre", {})
         if pre:
             with st.expander("🔵 PRE – Vorbereitung", expanded=True):
                 col1, col2 = st.columns([2, 1])
@@ -99,15 +152,14 @@ def render_session_detail(session: dict, curriculum: dict, team_logo_callback=No
                     render_confidence_metric(confidence)
         
         # Check-ins
-        checkins = session.get("checkins", [])
         if checkins:
             for checkin in checkins:
                 phase = checkin.get("phase", "")
-                answers = checkin.get("answers", {})
+                answers = checkin.get("answers") or {}
                 feedback = checkin.get("feedback", "")
                 next_task = checkin.get("next_task", "")
                 timestamp = checkin.get("timestamp", "")
-                
+
                 with st.expander(f"{render_phase_badge(phase)} Check-in", expanded=True):
                     # Show answers - better formatting
                     if answers:
@@ -135,7 +187,6 @@ def render_session_detail(session: dict, curriculum: dict, team_logo_callback=No
                         st.warning(next_task)
         
         # POST data
-        post = session.get("post", {})
         if post:
             with st.expander("✅ POST – Session Abschluss", expanded=True):
                 col1, col2 = st.columns([2, 1])
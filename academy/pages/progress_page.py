@@ -2,8 +2,9 @@
 import streamlit as st
 from pathlib import Path
 from academy.curriculum import load_curriculum
-from academy.sessions import list_sessions
+from academy.sessions_cache import cached_list_sessions
 from collections import defaultdict
+from operator import itemgetter
 
 
 def render_progress_page(
@@ -16,30 +17,33 @@ def render_progress_page(
     st.caption("Übersicht über deine Academy-Journey")
     
     curriculum = load_curriculum(curriculum_path)
-    user_sessions = list_sessions(sessions_dir, user=username)
+    user_sessions = cached_list_sessions(sessions_dir, user=username)
     
     if not user_sessions:
         st.info("Noch keine Sessions vorhanden. Starte deine erste Session im Session Trainer!")
         return
     
-    # Calculate stats
+    # Calculate overall + module stats in a single pass
     total_sessions = len(user_sessions)
-    completed_sessions = len([s for s in user_sessions if s.get("state") == "done"])
-    active_sessions = len([s for s in user_sessions if s.get("state") == "active"])
-    
-    # Module stats
+    completed_sessions = 0
+    active_sessions = 0
     module_counts = defaultdict(int)
-    module_helpfulness = defaultdict(list)
-    
+    module_helpfulness = defaultdict(lambda: [0, 0])  # module_id -> [sum, count]
+
     for session in user_sessions:
+        state = session.get("state")
+        completed_sessions += state == "done"
+        active_sessions += state == "active"
+
         module_id = session.get("module_id", "")
         if module_id:
             module_counts[module_id] += 1
-            
-            post = session.get("post", {})
-            helpfulness = post.get("helpfulness")
+
+            helpfulness = session.get("post", {}).get("helpfulness")
             if helpfulness:
-                module_helpfulness[module_id].append(helpfulness)
+                bucket = module_helpfulness[module_id]
+                bucket[0] += helpfulness
+                bucket[1] += 1
     
     # Display overall stats
     st.markdown("### 📊 Gesamt-Statistik")
@@ -65,7 +69,7 @@ def render_progress_page(
         return
     
     # Sort modules by count
-    sorted_modules = sorted(module_counts.items(), key=lambda x: x[1], reverse=True)
+    sorted_modules = sorted(module_counts.items(), key=itemgetter(1), reverse=True)
     
     for module_id, count in sorted_modules:
         with st.container(border=True):
@@ -78,8 +82,9 @@ def render_progress_page(
                 st.metric("Sessions", count)
             
             with col3:
-                if module_id in module_helpfulness and module_helpfulness[module_id]:
-                    avg_help = sum(module_helpfulness[module_id]) / len(module_helpfulness[module_id])
+                help_sum, help_count = module_helpfulness.get(module_id, (0, 0))
+                if help_count:
+                    avg_help = help_sum / help_count
                     stars = "⭐" * int(round(avg_help))
                     st.metric("Ø Helpfulness", stars)
                 else:
@@ -14,6 +14,86 @@ from academy.renderers import render_game_header, render_phase_badge, render_con
 from academy.drills import period_checkin, micro_quiz
 
 
+# Fallback DEL team list when the app doesn't provide one
+_DEFAULT_TEAMS: tuple[str, ...] = (
+    "ERC Ingolstadt",
+    "Adler Mannheim",
+    "Eisbären Berlin",
+    "Red Bull München",
+    "Kölner Haie",
+    "Grizzlys Wolfsburg",
+    "Pinguins Bremerhaven",
+    "Straubing Tigers",
+    "Nürnberg Ice Tigers",
+    "Augsburger Panther",
+    "Schwenninger Wild Wings",
+    "Düsseldorfer EG",
+    "Iserlohn Roosters",
+    "Löwen Frankfurt",
+)
+
+# Drill-specific goal suggestions
+_DRILL_GOALS: dict[str, tuple[str, ...]] = {
+    "A1_D1": (
+        "Dreiecke in der D-Zone bewusst erkennen",
+        "Center-Positionierung (low/middle/high) verstehen",
+        "Breakout-Qualität bewerten lernen",
+        "Forward-Positioning beim Puck-Retrieval beobachten",
+        "Dreieck-Stabilität über alle 3 Drittel verfolgen",
+    ),
+    "A1_Q1": (
+        "Grundlagen-Wissen zu Rollen festigen",
+        "Dreieck-Konzept verinnerlichen",
+        "Center-Aufgaben in D-Zone lernen",
+        "Begriffe sicher anwenden können",
+    ),
+    "default": (
+        "Konzepte aus diesem Drill im Spiel erkennen",
+        "Bewertungs-Kompetenz entwickeln",
+        "System-Reads verbessern",
+    ),
+}
+
+
+def _limited_select(label: str, options, key: str, limit: int = 50, default=None):
+    """Selectbox rendering at most ``limit`` options.
+
+    st.selectbox pushes its full option list into the DOM on every rerun,
+    which gets sluggish for large lists; capping the count keeps the render
+    bounded regardless of how big ``options`` grows. No search field: inside
+    st.form typing doesn't rerun, so a filter input would only apply on
+    submit — and could silently swap the selection out from under the user.
+    """
+    filt = list(options)[:limit]
+    if not filt:
+        st.warning(f"Keine Optionen für '{label}' verfügbar.")
+        return None
+    idx = filt.index(default) if default in filt else 0
+    return st.selectbox(label, filt, index=idx, key=key)
+
+
+def _curriculum_mtime(curriculum_path: Path) -> int:
+    return curriculum_path.stat().st_mtime_ns if curriculum_path.exists() else 0
+
+
+@st.cache_data(show_spinner=False)
+def _module_options(path_str: str, mtime_ns: int) -> tuple[list[str], list[str]]:
+    """Parallel (labels, ids) lists for the module dropdown, rebuilt only when the curriculum changes."""
+    modules = list_modules(load_curriculum(Path(path_str)))
+    labels = [f"{m['module_id']} – {m['module_title']}" for m in modules]
+    ids = [m["module_id"] for m in modules]
+    return labels, ids
+
+
+@st.cache_data(show_spinner=False)
+def _drill_options(path_str: str, mtime_ns: int, module_id: str) -> tuple[list[str], list[str]]:
+    """Parallel (labels, ids) lists for one module's drill dropdown, cached like _module_options."""
+    drills = list_drills_for_module(load_curriculum(Path(path_str)), module_id)
+    labels = [f"{d['drill_id']} – {d['drill_title']}" for d in drills]
+    ids = [d["drill_id"] for d in drills]
+    return labels, ids
+
+
 def render_session_trainer_page(
     curriculum_path: Path,
     sessions_dir: Path,
@@ -31,52 +111,38 @@ def render_session_trainer_page(
     # If POST just finished, force showing setup
     if st.session_state.get("force_new_session"):
         st.session_state.pop("force_new_session", None)
-        render_session_setup(curriculum, sessions_dir, user, username, team_list)
+        render_session_setup(curriculum_path, sessions_dir, user, username, team_list)
         return
 
-    # IMPORTANT: Always reload fresh from disk, never cache
-    if hasattr(st.session_state, "_active_session_cache"):
-        delattr(st.session_state, "_active_session_cache")
-
-    active_session = get_active_session(sessions_dir, username)
+    # When we already know there is no active session, skip the disk
+    # lookup entirely — the setup path becomes O(1) per rerun.
+    if st.session_state.get("has_active") is False:
+        render_session_setup(curriculum_path, sessions_dir, user, username, team_list)
+        return
 
-    # Reload from disk to be 100% sure state is active
-    if active_session:
-        fresh = load_session(sessions_dir, active_session["session_id"])
-        if not fresh or fresh.get("state") != "active":
-            active_session = None
-        else:
-            active_session = fresh
+    # Active session is kept in session_state and invalidated by the
+    # mutating actions (save, complete, cancel), so the disk lookup runs
+    # once instead of twice per rerun.
+    active_session = st.session_state.get("active_session")
+    if active_session is None or active_session.get("user") != username:
+        active_session = get_active_session(sessions_dir, username)
+        st.session_state["active_session"] = active_session
+        st.session_state["has_active"] = active_session is not None
 
     if active_session:
         render_active_session(active_session, curriculum, sessions_dir, user, username, team_logo_callback)
     else:
-        render_session_setup(curriculum, sessions_dir, user, username, team_list)
+        render_session_setup(curriculum_path, sessions_dir, user, username, team_list)
 
 
-def render_session_setup(curriculum: dict, sessions_dir: Path, user: str, username: str, team_list=None):
+def render_session_setup(curriculum_path: Path, sessions_dir: Path, user: str, username: str, team_list=None):
     """Render session setup form (PRE phase)."""
     st.subheader("🆕 Neue Session starten")
     
     # Default DEL teams if no list provided
     if team_list is None:
-        team_list = [
-            "ERC Ingolstadt",
-            "Adler Mannheim",
-            "Eisbären Berlin",
-            "Red Bull München",
-            "Kölner Haie",
-            "Grizzlys Wolfsburg",
-            "Pinguins Bremerhaven",
-            "Straubing Tigers",
-            "Nürnberg Ice Tigers",
-            "Augsburger Panther",
-            "Schwenninger Wild Wings",
-            "Düsseldorfer EG",
-            "Iserlohn Roosters",
-            "Löwen Frankfurt"
-        ]
-    
+        team_list = _DEFAULT_TEAMS
+
     with st.form("session_setup"):
         col1, col2 = st.columns(2)
         
@@ -87,77 +153,56 @@ def render_session_setup(curriculum: dict, sessions_dir: Path, user: str, userna
             league = st.text_input("Liga", value="DEL")
         
         with col2:
-            home = st.selectbox("Team Home", team_list, index=0)
-            away = st.selectbox("Team Away", team_list, index=1)
+            home = _limited_select("Team Home", team_list, key="setup_home")
+            away = _limited_select(
+                "Team Away", team_list, key="setup_away",
+                default=team_list[1] if len(team_list) > 1 else None
+            )
         
         st.divider()
         
-        # Module selection
-        modules = list_modules(curriculum)
-        if not modules:
+        # Module selection (options cached per curriculum snapshot)
+        mtime_ns = _curriculum_mtime(curriculum_path)
+        module_labels, module_ids = _module_options(str(curriculum_path), mtime_ns)
+        if not module_ids:
             st.warning("Keine Module verfügbar.")
             st.stop()
-        
-        module_options = {
-            f"{m['module_id']} – {m['module_title']}": m["module_id"]
-            for m in modules
-        }
-        
+
         # Check if module was preselected from Curriculum page
-        default_idx = 0
-        if "selected_module_id" in st.session_state:
-            preselect_id = st.session_state["selected_module_id"]
-            for i, (label, mod_id) in enumerate(module_options.items()):
-                if mod_id == preselect_id:
-                    default_idx = i
-                    st.info(f"✅ Modul **{preselect_id}** aus Curriculum vorausgewählt")
-                    break
-        
-        selected_module_label = st.selectbox("Modul auswählen", list(module_options.keys()), index=default_idx)
-        selected_module_id = module_options[selected_module_label]
-        
-        # Drill selection
-        drills = list_drills_for_module(curriculum, selected_module_id)
-        
-        if not drills:
+        default_label = None
+        preselect_id = st.session_state.get("selected_module_id")
+        if preselect_id in module_ids:
+            default_label = module_labels[module_ids.index(preselect_id)]
+            st.info(f"✅ Modul **{preselect_id}** aus Curriculum vorausgewählt")
+
+        selected_module_label = _limited_select(
+            "Modul auswählen", module_labels, key="setup_module", default=default_label
+        )
+        if selected_module_label is None:
+            st.form_submit_button("Session starten", disabled=True)
+            return
+        selected_module_id = module_ids[module_labels.index(selected_module_label)]
+
+        # Drill selection (options cached per curriculum snapshot)
+        drill_labels, drill_ids = _drill_options(str(curriculum_path), mtime_ns, selected_module_id)
+
+        if not drill_ids:
             st.warning(f"Modul {selected_module_id} hat noch keine Drills.")
             st.form_submit_button("Session starten", disabled=True)
             return
-        
-        drill_options = {
-            f"{d['drill_id']} – {d['drill_title']}": d["drill_id"]
-            for d in drills
-        }
-        
-        selected_drill_label = st.selectbox("Drill auswählen", list(drill_options.keys()))
-        selected_drill_id = drill_options[selected_drill_label]
+
+        selected_drill_label = _limited_select(
+            "Drill auswählen", drill_labels, key="setup_drill"
+        )
+        if selected_drill_label is None:
+            st.form_submit_button("Session starten", disabled=True)
+            return
+        selected_drill_id = drill_ids[drill_labels.index(selected_drill_label)]
         
         st.divider()
         
-        # Drill-specific goal suggestions
-        drill_goals = {
-            "A1_D1": [
-                "Dreiecke in der D-Zone bewusst erkennen",
-                "Center-Positionierung (low/middle/high) verstehen",
-                "Breakout-Qualität bewerten lernen",
-                "Forward-Positioning beim Puck-Retrieval beobachten",
-                "Dreieck-Stabilität über alle 3 Drittel verfolgen"
-            ],
-            "A1_Q1": [
-                "Grundlagen-Wissen zu Rollen festigen",
-                "Dreieck-Konzept verinnerlichen",
-                "Center-Aufgaben in D-Zone lernen",
-                "Begriffe sicher anwenden können"
-            ],
-            "default": [
-                "Konzepte aus diesem Drill im Spiel erkennen",
-                "Bewertungs-Kompetenz entwickeln",
-                "System-Reads verbessern"
-            ]
-        }
-        
         # Get goals for selected drill or use default
-        goal_options = drill_goals.get(selected_drill_id, drill_goals["default"]) + ["Eigenes Ziel..."]
+        goal_options = list(_DRILL_GOALS.get(selected_drill_id, _DRILL_GOALS["default"])) + ["Eigenes Ziel..."]
         
         goal_preset = st.selectbox("Ziel dieser Session", goal_options)
         
@@ -189,6 +234,8 @@ def render_session_setup(curriculum: dict, sessions_dir: Path, user: str, userna
             confidence=confidence
         )
         
+        st.session_state["active_session"] = session
+        st.session_state["has_active"] = True
         st.success(f"✅ Session {session['session_id']} erstellt!")
         st.rerun()
 
@@ -220,6 +267,8 @@ def render_active_session(
                 # Mark current session as cancelled
                 session["state"] = "cancelled"
                 save_session(sessions_dir, session)
+                st.session_state.pop("active_session", None)
+                st.session_state["has_active"] = False
                 st.success("Session abgebrochen. Neue Session starten...")
                 st.rerun()
     else:
@@ -243,6 +292,8 @@ def render_active_session(
                 if fresh_session:
                     complete_session(fresh_session, summary, unclear, "", 3)
                     save_session(sessions_dir, fresh_session)
+                    st.session_state.pop("active_session", None)
+                    st.session_state["has_active"] = False
                     st.session_state["force_new_session"] = True
                     st.session_state["show_post_form"] = False
                     st.success("✅ Session mit Notizen abgeschlossen!")
@@ -255,6 +306,8 @@ def render_active_session(
             if fresh_session:
                 complete_session(fresh_session, "", "", "", 3)
                 save_session(sessions_dir, fresh_session)
+                st.session_state.pop("active_session", None)
+                st.session_state["has_active"] = False
                 st.session_state["force_new_session"] = True
                 st.session_state["show_post_form"] = False
                 st.success("✅ Session abgeschlossen!")
@@ -293,21 +346,25 @@ def render_active_session(
     # Phase selector
     phases = ["PRE", "P1", "P2", "P3"]
     checkins = session.get("checkins", [])
-    completed_phases = [c["phase"] for c in checkins]
-    
+    completed_phases = {c["phase"] for c in checkins}
+
     st.markdown("### Phase auswählen")
-    phase_cols = st.columns(len(phases))
-    
-    selected_phase = None
-    for i, phase in enumerate(phases):
-        with phase_cols[i]:
-            badge = render_phase_badge(phase)
-            is_completed = phase in completed_phases
-            button_label = f"{badge}\n{'✅' if is_completed else ''}"
-            
-            if st.button(button_label, key=f"phase_{phase}", use_container_width=True):
-                selected_phase = phase
-    
+
+    def _phase_label(phase: str) -> str:
+        badge = render_phase_badge(phase)
+        return f"{badge} ✅" if phase in completed_phases else badge
+
+    # One radio widget instead of four buttons in separate columns
+    selected_phase = st.radio(
+        "Phase",
+        phases,
+        index=None,
+        format_func=_phase_label,
+        horizontal=True,
+        key="phase_sel",
+        label_visibility="collapsed"
+    )
+
     if not selected_phase:
         st.info("👆 Wähle eine Phase aus (PRE für vor dem Spiel, P1/P2/P3 für Drittelpausen).")
         return
@@ -352,7 +409,8 @@ def render_active_session(
         # Save checkin
         add_checkin(session, selected_phase, answers, feedback, next_task)
         save_session(sessions_dir, session)
-        
+        st.session_state.pop("active_session", None)
+
         st.success(f"✅ Check-in {selected_phase} gespeichert!")
         
         # Show button to continue
@@ -50,21 +50,27 @@ def render_module_card(track_id: str, track_title: str, module: dict, expanded:
             st.warning("Noch keine Drills verfügbar.")
 
 
+# Badge strings prebuilt once; render_phase_badge runs per phase per rerun
+_PHASE_BADGE = {
+    "PRE": "🔵 PRE",
+    "P1": "1️⃣ P1",
+    "P2": "2️⃣ P2",
+    "P3": "3️⃣ P3",
+    "POST": "✅ POST"
+}
+
+# Indexed by confidence 1-5 (slot 0 unused)
+_CONF_EMOJI = ("🔴", "🔴", "🔴", "🟡", "🟢", "🟢")
+
+
 def render_phase_badge(phase: str) -> str:
     """Render a phase badge with color."""
-    badges = {
-        "PRE": "🔵",
-        "P1": "1️⃣",
-        "P2": "2️⃣",
-        "P3": "3️⃣",
-        "POST": "✅"
-    }
-    return badges.get(phase, "❓") + " " + phase
+    return _PHASE_BADGE.get(phase) or f"❓ {phase}"
 
 
 def render_confidence_metric(confidence: int):
     """Render confidence as metric."""
-    emoji = "🟢" if confidence >= 4 else "🟡" if confidence >= 3 else "🔴"
+    emoji = _CONF_EMOJI[max(0, min(confidence, 5))]
     st.metric("Confidence", f"{confidence}/5 {emoji}")
 
 
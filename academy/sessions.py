@@ -1,9 +1,101 @@
 """Session management: create, load, save, list sessions."""
 import json
-from pathlib import Path
+import os
 from datetime import datetime
+from pathlib import Path
 from typing import Optional
 
+import streamlit as st
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover - orjson is optional
+    _loads = json.loads
+
+
+# Session files are machine-read; write them compact. Set MATCHHUB_PRETTY=1
+# to get indented files for manual inspection.
+_PRETTY = os.environ.get("MATCHHUB_PRETTY") == "1"
+
+
+def _ts() -> str:
+    """Local-time ISO timestamp with microseconds, so sessions touched within
+    the same second still sort deterministically by created_at/updated_at."""
+    return datetime.now().isoformat()
+
+
+def _dumps_session(session: dict) -> str:
+    if _PRETTY:
+        return json.dumps(session, ensure_ascii=False, indent=2)
+    return json.dumps(session, ensure_ascii=False, separators=(",", ":"))
+
+
+def _write_session_file(filepath: Path, session: dict) -> None:
+    """Write via a sibling tempfile + os.replace so readers never see a partial file."""
+    tmp = filepath.with_suffix(".json.tmp")
+    tmp.write_text(_dumps_session(session), encoding="utf-8")
+    os.replace(tmp, filepath)
+
+
+@st.cache_data(show_spinner=False)
+def _load_session_cached(path_str: str, mtime_ns: int) -> dict:
+    """Parse one session file once per (path, mtime); reused across reruns."""
+    return _loads(Path(path_str).read_bytes())
+
+
+# Summary index: one small file holding the metadata needed for listing
+# and filtering, so full session files are only parsed on demand.
+_INDEX_NAME = "_index.json"
+_INDEX_FIELDS = ("session_id", "user", "module_id", "state", "created_at", "updated_at")
+
+
+def _index_row(session: dict) -> dict:
+    return {k: session.get(k) for k in _INDEX_FIELDS}
+
+
+def _load_index(sessions_dir: Path) -> dict:
+    path = sessions_dir / _INDEX_NAME
+    if not path.exists():
+        return {}
+    try:
+        return _loads(path.read_bytes())
+    except Exception:
+        return {}
+
+
+def _write_index(sessions_dir: Path, index: dict) -> None:
+    path = sessions_dir / _INDEX_NAME
+    tmp = path.with_suffix(".json.tmp")
+    tmp.write_text(json.dumps(index, ensure_ascii=False), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def _index_upsert(sessions_dir: Path, session: dict) -> None:
+    index = _load_index(sessions_dir)
+    index[session["session_id"]] = _index_row(session)
+    _write_index(sessions_dir, index)
+
+
+def _session_files(sessions_dir: Path):
+    for filepath in sessions_dir.glob("*.json"):
+        if filepath.name != _INDEX_NAME:
+            yield filepath
+
+
+def _rebuild_index(sessions_dir: Path) -> dict:
+    """Rebuild the summary index from the session files on disk."""
+    index = {}
+    for filepath in _session_files(sessions_dir):
+        try:
+            session = _load_session_cached(str(filepath), filepath.stat().st_mtime_ns)
+        except Exception:
+            continue
+        if session.get("session_id"):
+            index[session["session_id"]] = _index_row(session)
+    _write_index(sessions_dir, index)
+    return index
+
 
 def create_session(
     sessions_dir: Path,
@@ -18,8 +110,11 @@ def create_session(
     confidence: int = 3
 ) -> dict:
     """Create a new session."""
-    session_id = f"{date}_{home.replace(' ', '_')}_vs_{away.replace(' ', '_')}_{user}_{module_id}_{drill_id}"
-    
+    now_iso = _ts()
+    home_slug = "_".join(home.split())
+    away_slug = "_".join(away.split())
+    session_id = f"{date}_{home_slug}_vs_{away_slug}_{user}_{module_id}_{drill_id}"
+
     session = {
         "session_id": session_id,
         "user": user,
@@ -34,22 +129,23 @@ def create_session(
         "pre": {
             "goal": goal,
             "confidence": confidence,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now_iso
         },
         "checkins": [],
         "post": {},
         "state": "active",
-        "created_at": datetime.now().isoformat(),
-        "updated_at": datetime.now().isoformat()
+        "created_at": now_iso,
+        "updated_at": now_iso
     }
     
     # Save to file
     sessions_dir.mkdir(parents=True, exist_ok=True)
     filepath = sessions_dir / f"{session_id}.json"
     
-    with open(filepath, "w", encoding="utf-8") as f:
-        json.dump(session, f, indent=2, ensure_ascii=False)
-    
+    _write_session_file(filepath, session)
+
+    _index_upsert(sessions_dir, session)
+
     return session
 
 
@@ -65,19 +161,20 @@ def load_session(sessions_dir: Path, session_id: str) -> Optional[dict]:
 
 def save_session(sessions_dir: Path, session: dict):
     """Save session to file."""
-    session["updated_at"] = datetime.now().isoformat()
+    session["updated_at"] = _ts()
     session_id = session["session_id"]
     filepath = sessions_dir / f"{session_id}.json"
     
-    with open(filepath, "w", encoding="utf-8") as f:
-        json.dump(session, f, indent=2, ensure_ascii=False)
+    _write_session_file(filepath, session)
+
+    _index_upsert(sessions_dir, session)
 
 
 def add_checkin(session: dict, phase: str, answers: dict, feedback: str = "", next_task: str = ""):
     """Add a checkin to the session."""
     checkin = {
         "phase": phase,
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": _ts(),
         "answers": answers,
         "feedback": feedback,
         "next_task": next_task
@@ -94,42 +191,70 @@ def complete_session(session: dict, summary: str = "", unclear: str = "", next_m
         "unclear": unclear,
         "next_module": next_module,
         "helpfulness": helpfulness,
-        "timestamp": datetime.now().isoformat()
+        "timestamp": _ts()
     }
     session["state"] = "done"
     return session
 
 
+def _current_index(sessions_dir: Path) -> dict:
+    """Load the index, rebuilding it when files were added or removed behind its back."""
+    index = _load_index(sessions_dir)
+    file_count = sum(1 for _ in _session_files(sessions_dir))
+    if len(index) != file_count:
+        index = _rebuild_index(sessions_dir)
+    return index
+
+
 def list_sessions(sessions_dir: Path, user: Optional[str] = None, module_id: Optional[str] = None) -> list[dict]:
-    """List all sessions, optionally filtered by user or module."""
+    """List all sessions, optionally filtered by user or module.
+
+    Filtering and ordering run against the summary index; only matching
+    session files are parsed in full.
+    """
     if not sessions_dir.exists():
         return []
-    
-    sessions = []
-    for filepath in sessions_dir.glob("*.json"):
-        try:
-            with open(filepath, "r", encoding="utf-8") as f:
-                session = json.load(f)
-                
-                # Apply filters
-                if user and session.get("user") != user:
-                    continue
-                if module_id and session.get("module_id") != module_id:
-                    continue
-                
-                sessions.append(session)
-        except Exception:
-            continue
-    
-    # Sort by created_at descending
-    sessions.sort(key=lambda s: s.get("created_at", ""), reverse=True)
-    return sessions
+
+    rows = [
+        r for r in _current_index(sessions_dir).values()
+        if (not user or r.get("user") == user)
+        and (not module_id or r.get("module_id") == module_id)
+    ]
+    rows.sort(key=lambda r: r["created_at"] or "", reverse=True)
+
+    # One directory scan supplies every mtime; writes are atomic, so no
+    # per-file try/except is needed in the loop — an index row whose file
+    # vanished since the index was written simply misses the lookup.
+    mtimes = {}
+    with os.scandir(sessions_dir) as entries:
+        for entry in entries:
+            if entry.name.endswith(".json") and entry.name != _INDEX_NAME:
+                mtimes[entry.name] = entry.stat().st_mtime_ns
+
+    return [
+        _load_session_cached(str(sessions_dir / name), mtimes[name])
+        for name in (f"{row['session_id']}.json" for row in rows)
+        if name in mtimes
+    ]
 
 
 def get_active_session(sessions_dir: Path, user: str) -> Optional[dict]:
-    """Get the most recent active session for a user."""
-    sessions = list_sessions(sessions_dir, user=user)
-    for session in sessions:
-        if session.get("state") == "active":
+    """Get the most recent active session for a user.
+
+    Scans the summary index instead of parsing session files; only the
+    matching session is loaded in full.
+    """
+    if not sessions_dir.exists():
+        return None
+
+    rows = [
+        r for r in _current_index(sessions_dir).values()
+        if r.get("user") == user and r.get("state") == "active"
+    ]
+    rows.sort(key=lambda r: r.get("updated_at") or "", reverse=True)
+
+    for row in rows:
+        session = load_session(sessions_dir, row["session_id"])
+        if session and session.get("state") == "active":
             return session
     return None
@@ -0,0 +1,19 @@
+"""Cached wrappers around session disk scans for Streamlit pages."""
+from pathlib import Path
+from typing import Optional
+
+import streamlit as st
+
+from academy.sessions import list_sessions
+
+
+@st.cache_data(show_spinner=False)
+def _cached_list_sessions(dir_str: str, dir_mtime_ns: int, user: Optional[str]) -> list[dict]:
+    """Scan + parse all sessions once per (dir, mtime, user); reused across reruns."""
+    return list_sessions(Path(dir_str), user=user)
+
+
+def cached_list_sessions(sessions_dir: Path, user: Optional[str] = None) -> list[dict]:
+    """List sessions, re-scanning disk only when the directory changed."""
+    mtime_ns = sessions_dir.stat().st_mtime_ns if sessions_dir.exists() else 0
+    return _cached_list_sessions(str(sessions_dir), mtime_ns, user)
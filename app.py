@@ -1,9 +1,14 @@
 import streamlit as st
 from pathlib import Path
+from collections import Counter
 import json
+import os
+import re
 import yaml
 from yaml.loader import SafeLoader
 import streamlit_authenticator as stauth
+import numpy as np
+import pandas as pd
 
 from del_fetch import (
     fetch_table,
@@ -11,13 +16,18 @@ from del_fetch import (
     fetch_team_recent_games,
     read_cache,
     pick_next_erc_game,
-    find_team_row,
     ERC_NAME,
     TEAM_MAPPING,
 )
-from storage import save_submission, list_submissions, load_json
+from storage import save_submission, submission_index
 from datetime import datetime
 
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover - orjson is optional
+    _loads = json.loads
+
 
 # =====================================
 # SETUP
@@ -33,6 +43,15 @@ LOGO_DIR = DATA_DIR / "teamlogos"
 TABLE_CACHE = CACHE_DIR / "del_table.json"
 FIXTURES_CACHE = CACHE_DIR / "del_fixtures.json"
 
+
+def _recent_cache_path(team: str) -> Path:
+    """Cache file for a team's recent games (same naming as del_fetch)."""
+    short = TEAM_MAPPING.get(team, team.replace(" ", "_"))
+    return CACHE_DIR / f"recent_{short.lower()}.json"
+
+
+ERC_RECENT_CACHE = _recent_cache_path(ERC_NAME)
+
 # Load team logo mapping
 TEAM_LOGO_MAP = {}
 try:
@@ -81,108 +100,286 @@ username = st.session_state.get("username")
 # HELPER FUNCTIONS
 # =====================================
 
-def team_logo(team_name: str, width: int = 60):
-    """Display team logo if available. Single source of truth for logos."""
+@st.cache_resource(show_spinner=False)
+def _logo_path(team_name: str):
+    """Resolve a team's logo file once per process; None if not available."""
     filename = TEAM_LOGO_MAP.get(team_name)
     if not filename:
-        return
+        return None
     path = LOGO_DIR / filename
-    if path.exists():
-        st.image(str(path), width=width)
+    return str(path) if path.exists() else None
+
+
+def team_logo(team_name: str, width: int = 60):
+    """Display team logo if available. Single source of truth for logos."""
+    path = _logo_path(team_name)
+    if path:
+        st.image(path, width=width)
+
+
+def _cache_mtime(path: Path) -> int:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return 0
+
+
+def _dir_mtimes(dir_path: Path) -> dict:
+    """One scandir snapshot {filename: st_mtime_ns}; replaces per-file
+    exists()/stat() pairs on the rerun path."""
+    try:
+        with os.scandir(dir_path) as it:
+            return {e.name: e.stat().st_mtime_ns for e in it}
+    except OSError:
+        return {}
+
+
+@st.cache_data(show_spinner=False)
+def _read_cache_cached(path_str: str, mtime_ns: int):
+    """read_cache keyed on the file's mtime; unchanged caches parse once."""
+    return read_cache(Path(path_str))
+
+
+# ttl guards the day rollover: "next game" depends on today's date, not
+# just the fixtures file
+@st.cache_data(show_spinner=False, ttl=3600)
+def _next_erc_game_cached(path_str: str, mtime_ns: int):
+    """pick_next_erc_game over the fixtures cache, memoized per snapshot."""
+    wrap = _read_cache_cached(path_str, mtime_ns)
+    return pick_next_erc_game(wrap["data"]) if wrap else None
+
+
+@st.cache_data(show_spinner=False)
+def _wiki_cached(path_str: str, mtime_ns: int):
+    """Parsed wiki terms, pre-sorted names and a lowercased search index,
+    per file snapshot."""
+    with open(path_str, "rb") as f:
+        data = _loads(f.read())
+    sorted_terms = sorted(data.keys())
+    lower_index = tuple((t.lower(), t) for t in sorted_terms)
+    return data, sorted_terms, lower_index
+
+
+def get_wiki(path: Path):
+    """Wiki terms, sorted names and lowercased index; empty when missing."""
+    mtime_ns = _cache_mtime(path)
+    if not mtime_ns:
+        return {}, [], ()
+    return _wiki_cached(str(path), mtime_ns)
+
+
+@st.cache_data(show_spinner=False)
+def _team_index_cached(path_str: str, mtime_ns: int) -> dict:
+    """{cleaned team name: row} hash index over the table cache snapshot."""
+    from del_fetch import build_team_index
+    wrap = _read_cache_cached(path_str, mtime_ns)
+    if not wrap:
+        return {}
+    return build_team_index(wrap["data"])
+
+
+@st.cache_data(show_spinner=False)
+def _team_row_cached(path_str: str, mtime_ns: int, team_name: str):
+    """Team row lookup per snapshot and team: dict index instead of the
+    linear scans in find_team_row."""
+    index = _team_index_cached(path_str, mtime_ns)
+    row = index.get(team_name)
+    if row is None:
+        short_name = TEAM_MAPPING.get(team_name)
+        if short_name:
+            row = index.get(short_name)
+    return row
+
+
+@st.cache_data(show_spinner=False)
+def _comparison_df(erc_row: dict, opp_row: dict, opponent: str):
+    """Direct-comparison table; rebuilt only when the rows change."""
+    return pd.DataFrame({
+        "Kategorie": ["Platz", "Punkte", "Tore für", "Tore gegen", "Differenz"],
+        "ERC": [
+            f"#{erc_row.get('#', '?')}",
+            erc_row.get('P', '?'),
+            erc_row.get('GF', '?'),
+            erc_row.get('GA', '?'),
+            erc_row.get('GDIFF', '?')
+        ],
+        opponent: [
+            f"#{opp_row.get('#', '?')}",
+            opp_row.get('P', '?'),
+            opp_row.get('GF', '?'),
+            opp_row.get('GA', '?'),
+            opp_row.get('GDIFF', '?')
+        ]
+    })
+
+
+@st.cache_data(show_spinner=False)
+def _last_five_df(games: list):
+    """Display DataFrame for a team's last five; rebuilt only when the
+    games change, not on every rerun."""
+    df = pd.DataFrame(games)
+    display_df = df[["date", "score", "result"]].copy()
+    display_df.columns = ["Datum", "Ergebnis", "Typ"]
+    return display_df
+
+
+def _render_team_card(team: str, row) -> None:
+    """Team header card; one shared code path for the HOME and AWAY blocks."""
+    with st.container(border=True):
+        col_logo, col_info = st.columns([1, 3])
+        with col_logo:
+            team_logo(team, width=80)
+        with col_info:
+            st.markdown(f"### {team}")
+            st.caption("🏠 Heimspiel" if team == ERC_NAME else "✈️ Auswärts")
+
+            # Stats inline
+            if row:
+                st.markdown(
+                    f"**Platz #{row.get('#', '?')}** · {row.get('P', '?')} Punkte"
+                    f" · Tore {row.get('GF', '?')}:{row.get('GA', '?')}"
+                )
+
+
+def _render_last_five(games: list) -> None:
+    """Styled last-five table; one shared code path for both team columns."""
+
+    display_df = _last_five_df(games)
+    # Classify the whole Typ column at once instead of a Python styling
+    # call per cell (Styler.applymap is deprecated anyway)
+    typ = display_df["Typ"].to_numpy()
+    css = np.select(
+        [np.isin(typ, ("W", "OTW")), np.isin(typ, ("L", "OTL"))],
+        [
+            "background-color: #d4edda; color: #155724",
+            "background-color: #f8d7da; color: #721c24",
+        ],
+        default="",
+    )
+    st.dataframe(
+        display_df.style.apply(lambda col: css, subset=["Typ"]),
+        use_container_width=True,
+        hide_index=True,
+        height=220
+    )
 
 
 # =====================================
 # HELPER FUNCTIONS: Historie
 # =====================================
 
-def load_all_submissions(submissions_dir: Path) -> list[dict]:
-    """Load all submission JSON files with filename. Keep only latest per user + game."""
-    submissions = []
-    if not submissions_dir.exists():
-        return submissions
-    
-    # Load all
-    all_subs = []
-    for file_path in submissions_dir.glob("*.json"):
-        try:
-            data = load_json(file_path)
-            if data:
-                data["_filename"] = file_path.name
-                all_subs.append(data)
-        except Exception:
-            continue
-    
-    # Group by user + game_key, keep latest timestamp
-    from collections import defaultdict
-    grouped = defaultdict(list)
-    
-    for sub in all_subs:
-        user = sub.get("user", "unknown")
-        game = sub.get("game", {})
-        game_key = f"{game.get('date', 'unknown')}__{game.get('home', 'unknown')}__{game.get('away', 'unknown')}"
-        key = f"{user}__{game_key}"
-        grouped[key].append(sub)
-    
-    # For each group, keep only the latest (by timestamp/submitted_at)
-    for key, subs in grouped.items():
-        if len(subs) > 1:
-            # Sort by timestamp/submitted_at descending
-            subs.sort(key=lambda x: x.get("timestamp", x.get("submitted_at", "")), reverse=True)
-        submissions.append(subs[0])  # Keep latest
-    
-    return submissions
+@st.cache_data(show_spinner=False)
+def _load_one(path_str: str, mtime_ns: int, size: int) -> dict:
+    """Parse one JSON file; cached per (path, mtime, size) so unchanged
+    files are deserialized once per process instead of on every rerun."""
+    with open(path_str, "rb") as f:
+        return _loads(f.read())
+
+
+@st.cache_data(show_spinner=False)
+def _load_ndjson(path_str: str, mtime_ns: int, size: int) -> list:
+    """Parse an NDJSON log: one dict per non-empty line."""
+    with open(path_str, "rb") as f:
+        return [_loads(line) for line in f if line.strip()]
+
+
+def latest_submission_rows(submissions_dir: Path) -> list[dict]:
+    """Latest submission metadata per user + game, from the summary index.
+
+    Returns index rows only (filename, user, date, home, away, timestamp);
+    callers parse the full JSON lazily for the entry they actually show.
+    """
+    rows = list(submission_index(submissions_dir).values())
+    if len(rows) < 2:
+        return rows
+
+    # Vectorized "latest per user + game": one C-level sort + drop_duplicates
+    # instead of per-row Python grouping
+    df = pd.DataFrame(rows)
+    df = df.sort_values("timestamp").drop_duplicates(
+        subset=["user", "date", "home", "away"], keep="last"
+    )
+    return df.to_dict("records")
 
 
 def save_observation(observations_dir: Path, observation: dict) -> Path:
-    """Save observation to combined JSON file per game+user. Updates specific period."""
+    """Append one period check-in to the per-game+user NDJSON log.
+
+    One JSON line per save — O(1) instead of the old read-modify-rewrite
+    of a combined file per period. load_all_observations folds the log
+    (and legacy combined/single-period .json files) by period, keeping
+    the latest timestamp per period.
+    """
     observations_dir.mkdir(exist_ok=True)
-    
+
     user = observation.get("user", "unknown")
     game = observation.get("game", {})
     date = game.get("date", "unknown")
     home = game.get("home", "unknown").replace(" ", "_")
     away = game.get("away", "unknown").replace(" ", "_")
-    period = observation.get("period", 1)
-    
-    # Filename for combined observations
-    filename = f"{date}_{home}_vs_{away}_{user}.json"
-    filepath = observations_dir / filename
-    
-    # Load existing data or create new
-    if filepath.exists():
-        try:
-            with open(filepath, "r", encoding="utf-8") as f:
-                existing_data = json.load(f)
-        except:
-            existing_data = {}
-    else:
-        existing_data = {}
-    
-    # Update metadata
-    existing_data.update({
+
+    filepath = observations_dir / f"{date}_{home}_vs_{away}_{user}.ndjson"
+
+    record = {
         "user": user,
         "game": game,
+        "game_key": f"{date}__{game.get('home', 'unknown')}__{game.get('away', 'unknown')}",
         "focus": observation.get("focus", "CENTER_TRIANGLES"),
-        "last_updated": datetime.now().isoformat()
-    })
-    
-    # Update the specific period
-    if "periods" not in existing_data:
-        existing_data["periods"] = {}
-    
-    existing_data["periods"][str(period)] = {
-        "period": period,
+        "period": observation.get("period", 1),
         "timestamp": observation.get("timestamp"),
         "answers": observation.get("answers", {})
     }
-    
-    # Save back
-    with open(filepath, "w", encoding="utf-8") as f:
-        json.dump(existing_data, f, indent=2, ensure_ascii=False)
-    
+
+    with open(filepath, "a", encoding="utf-8") as f:
+        f.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n")
+
     return filepath
 
 
+def _merge_observation(merged: dict, data: dict) -> None:
+    """Fold one observation record into the per-(user, game) period maps.
+
+    NDJSON records and legacy single-period files carry a "period" field;
+    legacy combined files carry a "periods" dict. Per period number the
+    latest timestamp wins.
+    """
+    if "periods" in data:
+        file_periods = data["periods"].values()
+    elif "period" in data:
+        file_periods = [{
+            "period": data.get("period", 1),
+            "timestamp": data.get("timestamp"),
+            "answers": data.get("answers", {})
+        }]
+    else:
+        # Skip invalid records
+        return
+
+    game = data.get("game", {})
+    key = (
+        data.get("user", "unknown"),
+        game.get("date", "unknown"),
+        game.get("home", "unknown"),
+        game.get("away", "unknown"),
+    )
+    slot = merged.get(key)
+    if slot is None:
+        slot = merged[key] = {
+            "user": data.get("user"),
+            "game": game,
+            "game_key": data.get("game_key"),
+            "focus": data.get("focus"),
+            "period_map": {},
+        }
+
+    period_map = slot["period_map"]
+    for period in file_periods:
+        p_num = period.get("period", 1)
+        existing = period_map.get(p_num)
+        if existing is None or period.get("timestamp", "") > existing.get("timestamp", ""):
+            period_map[p_num] = period
+
+
 def load_all_observations(observations_dir: Path) -> list[dict]:
     """Load all observation JSON files. Each file contains all periods for a game+user."""
     observations = []
@@ -190,97 +387,77 @@ def load_all_observations(observations_dir: Path) -> list[dict]:
         return observations
     
     # Load all
-    all_obs = []
-    for file_path in observations_dir.glob("*.json"):
+    # os.scandir hands back entries with a cached stat, avoiding the extra
+    # syscall per file that Path.glob + stat() would pay
+    with os.scandir(observations_dir) as it:
+        entries = [e for e in it if e.name.endswith((".json", ".ndjson"))]
+
+    # One pass: merge periods per (user, game) while files are loaded,
+    # keeping the latest timestamp per period number. NDJSON logs carry
+    # one period record per line; legacy .json files carry either a
+    # "periods" dict or a single "period".
+    merged = {}
+    for entry in entries:
         try:
-            data = load_json(file_path)
-            if data:
-                data["_filename"] = file_path.name
-                
-                # Check if this is new format (has "periods" key) or old format (has "period" key)
-                if "periods" in data:
-                    # New format: already has periods as dict, convert to list
-                    periods_dict = data.get("periods", {})
-                    periods_list = []
-                    for period_key, period_data in periods_dict.items():
-                        periods_list.append(period_data)
-                    
-                    # Sort by period
-                    periods_list.sort(key=lambda x: x.get("period", 1))
-                    
-                    data["periods"] = periods_list
-                elif "period" in data:
-                    # Old format: single period observation, wrap in list
-                    single_period = {
-                        "period": data.get("period", 1),
-                        "timestamp": data.get("timestamp"),
-                        "answers": data.get("answers", {})
-                    }
-                    data["periods"] = [single_period]
-                else:
-                    # Skip invalid files
-                    continue
-                
-                all_obs.append(data)
+            stat = entry.stat()
+            if entry.name.endswith(".ndjson"):
+                records = _load_ndjson(entry.path, stat.st_mtime_ns, stat.st_size)
+            else:
+                data = _load_one(entry.path, stat.st_mtime_ns, stat.st_size)
+                records = [data] if data else []
         except Exception:
             continue
-    
-    # Group by user + game_key, collect all periods
-    from collections import defaultdict
-    grouped = defaultdict(list)
-    
-    for obs in all_obs:
-        user = obs.get("user", "unknown")
-        game = obs.get("game", {})
-        game_key = f"{game.get('date', 'unknown')}__{game.get('home', 'unknown')}__{game.get('away', 'unknown')}"
-        key = f"{user}__{game_key}"
-        grouped[key].append(obs)
-    
-    # For each group, combine all periods
-    for key, obs_list in grouped.items():
-        # Collect all periods from all observations in this group
-        all_periods = []
-        for obs in obs_list:
-            all_periods.extend(obs.get("periods", []))
-        
-        # Sort by period and remove duplicates (keep latest timestamp)
-        period_map = {}
-        for period in all_periods:
-            p_num = period.get("period", 1)
-            if p_num not in period_map or period.get("timestamp", "") > period_map[p_num].get("timestamp", ""):
-                period_map[p_num] = period
-        
-        combined_periods = list(period_map.values())
-        combined_periods.sort(key=lambda x: x.get("period", 1))
-        
-        # Create combined entry
+
+        for data in records:
+            _merge_observation(merged, data)
+
+    for slot in merged.values():
+        # Periods are 1-3; fill fixed slots instead of sorting per entry
+        ordered = [None, None, None, None]
+        extras = []
+        for p_num, period in slot["period_map"].items():
+            if isinstance(p_num, int) and 1 <= p_num <= 3:
+                ordered[p_num] = period
+            else:
+                extras.append(period)
+        combined_periods = [p for p in ordered if p is not None]
+        if extras:
+            # Out-of-range period numbers from hand-edited files
+            extras.sort(key=lambda x: x.get("period", 1))
+            combined_periods.extend(extras)
         if combined_periods:
-            combined = {
-                "user": obs_list[0].get("user"),
-                "game": obs_list[0].get("game"),
-                "focus": obs_list[0].get("focus"),
+            observations.append({
+                "user": slot["user"],
+                "game": slot["game"],
+                "game_key": slot["game_key"],
+                "focus": slot["focus"],
                 "periods": combined_periods,
                 "timestamp": combined_periods[0].get("timestamp"),  # Use first timestamp
-            }
-            observations.append(combined)
-    
+            })
+
     return observations
 
 
+@st.cache_data(show_spinner=False)
+def _observations_cached(dir_str: str, snapshot: tuple) -> list[dict]:
+    """Merged observations per directory snapshot; reused across reruns.
+
+    The snapshot of (name, mtime_ns) pairs invalidates the entry whenever a
+    file is added, removed or rewritten, so the scan-and-merge pass only runs
+    when the directory actually changed.
+    """
+    return load_all_observations(Path(dir_str))
+
+
 def get_game_key(entry: dict, entry_type: str) -> str:
-    """Generate game key: YYYY-MM-DD__HOME__AWAY"""
-    if entry_type == "Pre-Match":
-        game = entry.get("game", {})
-        date = game.get("date", "unknown")
-        home = game.get("home", "unknown")
-        away = game.get("away", "unknown")
-    else:  # Beobachtung
-        game = entry.get("game", {})
-        date = game.get("date", "unknown")
-        home = game.get("home", "unknown")
-        away = game.get("away", "unknown")
-    
-    return f"{date}__{home}__{away}"
+    """Game key YYYY-MM-DD__HOME__AWAY; precomputed at save time when present."""
+    game_key = entry.get("game_key")
+    if game_key:
+        return game_key
+
+    # Legacy entries from before game_key was stored
+    game = entry.get("game", {})
+    return f"{game.get('date', 'unknown')}__{game.get('home', 'unknown')}__{game.get('away', 'unknown')}"
 
 
 def format_game_display(game_key: str) -> str:
@@ -292,6 +469,49 @@ def format_game_display(game_key: str) -> str:
     return game_key
 
 
+@st.cache_data(show_spinner=False)
+def _build_game_options(sub_snapshot: tuple, obs_snapshot: tuple) -> tuple:
+    """Historie dropdown structure, rebuilt only when a submission or
+    observation file changed.
+
+    Uses a composite key (type + game_key) so Pre-Match and Beobachtung for
+    dasselbe Spiel nicht kollidieren. Vorher wurde Beobachtung vom gleichen
+    Spiel durch das Pre-Match-Entry überschrieben und tauchte im Dropdown
+    nicht auf.
+
+    Returns (game_options, keys_by_type, labels_by_type): the per-type key
+    and display-label lists are filled during the same pass, so the type
+    dropdown doesn't rescan the dict per rerun.
+    """
+    submissions = latest_submission_rows(SUBMISSIONS_DIR)
+    observations = _observations_cached(str(DATA_DIR / "observations"), obs_snapshot)
+
+    game_options = {}
+    keys_by_type = {"Pre-Match": [], "Beobachtung": []}
+    labels_by_type = {"Pre-Match": [], "Beobachtung": []}
+
+    def _add(entry_type, game_key, entry):
+        composite_key = f"{entry_type}__{game_key}"
+        slot = game_options.get(composite_key)
+        if slot is None:
+            slot = game_options[composite_key] = {
+                "type": entry_type, "game_key": game_key, "entries": []
+            }
+            keys_by_type[entry_type].append(composite_key)
+            labels_by_type[entry_type].append(format_game_display(game_key))
+        slot["entries"].append(entry)
+
+    # Pre-Match games (index rows carry date/home/away directly)
+    for row in submissions:
+        _add("Pre-Match", f"{row['date']}__{row['home']}__{row['away']}", row)
+
+    # Beobachtung games (each entry contains all periods)
+    for obs in observations:
+        _add("Beobachtung", get_game_key(obs, "Beobachtung"), obs)
+
+    return game_options, keys_by_type, labels_by_type
+
+
 def display_pre_match_entry(entry: dict):
     """Display Pre-Match entry in card format."""
     game = entry.get("game", {})
@@ -406,10 +626,66 @@ def display_observation_entry(entry: dict):
                     st.success(period_data["learning_task"])
 
 
+# =====================================
+# BEOBACHTUNG: Antwort-Optionen
+# =====================================
+
+# Radio label → stored code. The labels are the single source for the
+# radio options, and the submit handler does one dict hit instead of a
+# split(" – ") + lower() per answer.
+_CENTER_OPTIONS = {
+    "Low – tief vor dem Slot": "low",
+    "Middle – Slot / Hashmarks": "middle",
+    "High – oberhalb der Kreise / Richtung Blaue": "high",
+}
+
+_BREAKOUT_OPTIONS = {
+    "Sauber – kontrollierter Aufbau": "sauber",
+    "Gemischt – mal Kontrolle, mal Chaos": "gemischt",
+    "Chaotisch – Blind Clears, Icing-Gefahr": "chaotisch",
+}
+
+# Sofort-Feedback rules, checked in order; first match wins. Pure data,
+# so new rules are one line here instead of another elif branch.
+_ANALYSIS_RULES = (
+    (
+        lambda c, t, b: c == "high" and t <= 2,
+        "**ERC verliert Struktur zwischen Slot und Blaue** – Dreiecke reißen früh.",
+        "Achte darauf, ob der Center früher absinkt, sobald der Gegner Druck aufbaut.",
+    ),
+    (
+        lambda c, t, b: c == "low" and b == "chaotisch",
+        "**Center steht zu tief** – fehlende Outlet-Option führt zu Blind Clears.",
+        "Beobachte, ob der Center rechtzeitig nach oben kommt, um den ersten Pass anzubieten.",
+    ),
+    (
+        lambda c, t, b: t >= 4 and b == "sauber",
+        "**Starke Struktur!** Dreiecke stabil, Breakouts kontrolliert.",
+        "Achte darauf, wie lange diese Struktur unter Druck hält.",
+    ),
+    (
+        lambda c, t, b: b == "gemischt",
+        "**Inkonsistenz** – mal funktioniert's, mal nicht.",
+        "Versuche zu erkennen, wann die Dreiecke zusammenbrechen (Forechecking-Druck? Tempo?).",
+    ),
+    (
+        lambda c, t, b: True,
+        "**Solide Basisarbeit** – Center und Dreiecke arbeiten zusammen.",
+        "Beobachte, wie sich das unter zunehmendem Druck entwickelt.",
+    ),
+)
+
+
 # =====================================
 # HELPER FUNCTIONS: Last Five Analysis
 # =====================================
 
+# Compiled once; re.match would pay the pattern-cache lookup per game.
+# The optional third group captures the overtime/shootout suffix so one
+# scan answers both "is there a score" and "did it go past regulation".
+_SCORE_RE = re.compile(r"(\d+):(\d+)(?:\s*(n\.[VP]\.))?")
+
+
 def get_last_five(fixtures: list[dict], team_name: str, max_games: int = 5) -> list[dict]:
     """
     Extract last N finished games for a specific team from fixtures.
@@ -426,75 +702,84 @@ def get_last_five(fixtures: list[dict], team_name: str, max_games: int = 5) -> l
     for when results are added to the fixtures cache, or you can extend
     fetch_fixtures() to scrape results as well.
     """
-    import re
-    from datetime import datetime
-    
-    today = datetime.now().date()
-    team_games = []
-    
-    for game in fixtures:
-        # Skip games without results
-        home = game.get("home", "")
-        away = game.get("away", "")
-        
-        # Check if team is involved
-        if team_name not in [home, away]:
-            continue
-        
-        # Check if game is in the past
-        try:
-            game_date = datetime.strptime(game["date"], "%Y-%m-%d").date()
-        except:
-            continue
-        
-        if game_date >= today:
-            continue
-        
-        # Check if result exists (we need a score)
-        # NOTE: Current fixtures don't have 'result' field yet
-        result_str = game.get("result", "")
-        if not result_str or result_str == "-":
-            continue
-        
-        # Parse result (format: "3:2" or "3:2 n.V." or "3:2 n.P.")
-        score_match = re.match(r"(\d+):(\d+)", result_str)
-        if not score_match:
-            continue
-        
-        home_goals = int(score_match.group(1))
-        away_goals = int(score_match.group(2))
-        
-        # Determine perspective: goals for/against from team's view
-        is_home = (home == team_name)
-        goals_for = home_goals if is_home else away_goals
-        goals_against = away_goals if is_home else home_goals
-        opponent = away if is_home else home
-        
-        # Determine result type
-        is_overtime = "n.V." in result_str or "n.P." in result_str
-        
-        if goals_for > goals_against:
-            result = "OTW" if is_overtime else "W"
-        elif goals_for < goals_against:
-            result = "OTL" if is_overtime else "L"
-        else:
-            result = "T"  # Shouldn't happen in DEL
-        
-        team_games.append({
-            "date": game["date"],
-            "opponent": opponent,
-            "home_away": "H" if is_home else "A",
-            "goals_for": goals_for,
-            "goals_against": goals_against,
-            "result": result,
-            "score": f"{goals_for}:{goals_against}",
-            "matchday": game.get("matchday", "?")
-        })
-    
-    # Sort by date descending (newest first)
-    team_games.sort(key=lambda x: x["date"], reverse=True)
-    
-    return team_games[:max_games]
+    if not fixtures:
+        return []
+
+
+    df = pd.DataFrame(fixtures)
+    if "home" not in df.columns or "away" not in df.columns:
+        return []
+
+    result_str = df["result"].fillna("") if "result" in df.columns else pd.Series("", index=df.index)
+    dates = pd.to_datetime(df.get("date"), format="%Y-%m-%d", errors="coerce")
+    today = pd.Timestamp(datetime.now().date())
+
+    # Boolean masks replace the per-game Python branching: team involved,
+    # game in the past, result present and parseable
+    is_home = df["home"].eq(team_name)
+    mask = (
+        (is_home | df["away"].eq(team_name))
+        & dates.notna()
+        & (dates < today)
+        & result_str.ne("")
+        & result_str.ne("-")
+    )
+    scores = result_str.str.extract(_SCORE_RE)
+    mask &= scores[0].notna()
+    if not mask.any():
+        return []
+
+    # Top-k by parsed date (O(N log k) instead of a full sort); nlargest
+    # hands the row labels back newest-first, so the per-game work below
+    # only touches the games actually returned
+    top = dates[mask].nlargest(max_games).index
+
+    f_is_home = is_home.loc[top].to_numpy()
+    home_goals = scores.loc[top, 0].astype(int).to_numpy()
+    away_goals = scores.loc[top, 1].astype(int).to_numpy()
+
+    # Perspective: goals for/against from the team's view
+    goals_for = np.where(f_is_home, home_goals, away_goals)
+    goals_against = np.where(f_is_home, away_goals, home_goals)
+    # The suffix group from the score extract answers overtime directly;
+    # no second pass over the result strings
+    is_overtime = scores.loc[top, 2].notna().to_numpy()
+
+    result = np.select(
+        [
+            (goals_for > goals_against) & is_overtime,
+            goals_for > goals_against,
+            (goals_for < goals_against) & is_overtime,
+            goals_for < goals_against,
+        ],
+        ["OTW", "W", "OTL", "L"],
+        default="T",  # Shouldn't happen in DEL
+    )
+
+    matchday = (
+        df.loc[top, "matchday"].fillna("?").to_numpy()
+        if "matchday" in df.columns
+        else np.full(len(goals_for), "?")
+    )
+
+    out = pd.DataFrame({
+        "date": df.loc[top, "date"].to_numpy(),
+        "opponent": np.where(f_is_home, df.loc[top, "away"], df.loc[top, "home"]),
+        "home_away": np.where(f_is_home, "H", "A"),
+        "goals_for": goals_for,
+        "goals_against": goals_against,
+        "result": result,
+        "score": pd.Series(goals_for).astype(str).str.cat(
+            pd.Series(goals_against).astype(str), sep=":"
+        ).to_numpy(),
+        "matchday": matchday,
+    })
+
+    records = out.to_dict("records")
+    for r in records:  # plain ints for the handful of returned rows
+        r["goals_for"] = int(r["goals_for"])
+        r["goals_against"] = int(r["goals_against"])
+    return records
 
 
 def get_last_five_from_recent(recent_games_data: dict, max_games: int = 5) -> list[dict]:
@@ -528,15 +813,17 @@ def get_last_five_from_recent(recent_games_data: dict, max_games: int = 5) -> li
 def calculate_form_summary(last_five: list[dict]) -> dict:
     """
     Calculate form summary from last five games.
-    
+
     Returns:
         Dict with W, OTW, OTL, L counts and formatted string
     """
-    w = sum(1 for g in last_five if g["result"] == "W")
-    otw = sum(1 for g in last_five if g["result"] == "OTW")
-    otl = sum(1 for g in last_five if g["result"] == "OTL")
-    l = sum(1 for g in last_five if g["result"] == "L")
-    
+    # Single pass instead of one generator expression per category
+    counts = Counter(g["result"] for g in last_five)
+    w = counts.get("W", 0)
+    otw = counts.get("OTW", 0)
+    otl = counts.get("OTL", 0)
+    l = counts.get("L", 0)
+
     return {
         "W": w,
         "OTW": otw,
@@ -547,6 +834,18 @@ def calculate_form_summary(last_five: list[dict]) -> dict:
     }
 
 
+@st.cache_data(show_spinner=False)
+def _form_cached(path_str: str, mtime_ns: int) -> tuple:
+    """Last-five rows plus form summary per recent-games snapshot.
+
+    Both derive purely from one cache file, so they are memoized together
+    on its mtime instead of recomputing on every widget event.
+    """
+    wrap = _read_cache_cached(path_str, mtime_ns)
+    last_five = get_last_five_from_recent(wrap.get("data", {}) if wrap else {}, max_games=5)
+    return last_five, calculate_form_summary(last_five)
+
+
 # =====================================
 # UI: TITLE & REFRESH
 # =====================================
@@ -556,29 +855,37 @@ st.caption(f"Willkommen, **{name}** 👋")
 
 
 def refresh():
+    from concurrent.futures import ThreadPoolExecutor
+
     with st.spinner("Hole DEL-Daten (Tabelle + Spielplan + Recent Games)…"):
-        fetch_table(CACHE_DIR)
-        fetch_fixtures(CACHE_DIR)
-        
-        # Fetch recent games for ERC
-        try:
-            fetch_team_recent_games(CACHE_DIR, ERC_NAME)
-        except Exception as e:
-            st.warning(f"Konnte Recent Games für ERC nicht laden: {e}")
-        
-        # Get opponent and fetch their recent games too
-        fixtures_wrap = read_cache(FIXTURES_CACHE)
-        if fixtures_wrap:
-            next_game = pick_next_erc_game(fixtures_wrap["data"])
-            if next_game:
-                home = next_game["home"]
-                away = next_game["away"]
-                opponent = away if home == ERC_NAME else home
-                try:
-                    fetch_team_recent_games(CACHE_DIR, opponent)
-                except Exception as e:
-                    st.warning(f"Konnte Recent Games für {opponent} nicht laden: {e}")
-    
+        # Independent HTTP fetches run in parallel instead of paying one
+        # round-trip after the other
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            future_table = pool.submit(fetch_table, CACHE_DIR)
+            future_fixtures = pool.submit(fetch_fixtures, CACHE_DIR)
+            future_erc = pool.submit(fetch_team_recent_games, CACHE_DIR, ERC_NAME)
+
+            future_table.result()
+            future_fixtures.result()
+
+            try:
+                future_erc.result()
+            except Exception as e:
+                st.warning(f"Konnte Recent Games für ERC nicht laden: {e}")
+
+            # Opponent depends on the fresh fixtures, so it follows them
+            fixtures_wrap = read_cache(FIXTURES_CACHE)
+            if fixtures_wrap:
+                next_game = pick_next_erc_game(fixtures_wrap["data"])
+                if next_game:
+                    home = next_game["home"]
+                    away = next_game["away"]
+                    opponent = away if home == ERC_NAME else home
+                    try:
+                        fetch_team_recent_games(CACHE_DIR, opponent)
+                    except Exception as e:
+                        st.warning(f"Konnte Recent Games für {opponent} nicht laden: {e}")
+
     st.success("Cache aktualisiert.")
 
 
@@ -671,8 +978,13 @@ else:
     # MATCHHUB (ORIGINAL CODE)
     # =====================================
     
-    table_wrap = read_cache(TABLE_CACHE)
-    fixtures_wrap = read_cache(FIXTURES_CACHE)
+    # One directory snapshot instead of an exists()/stat() pair per cache file
+    cache_mtimes = _dir_mtimes(CACHE_DIR)
+    table_mtime = cache_mtimes.get(TABLE_CACHE.name, 0)
+    fixtures_mtime = cache_mtimes.get(FIXTURES_CACHE.name, 0)
+
+    table_wrap = _read_cache_cached(str(TABLE_CACHE), table_mtime)
+    fixtures_wrap = _read_cache_cached(str(FIXTURES_CACHE), fixtures_mtime)
 
     if not table_wrap or not fixtures_wrap:
         st.warning("Cache ist leer. Links im Sidebar auf **DEL-Daten aktualisieren** klicken.")
@@ -681,7 +993,7 @@ else:
     table = table_wrap["data"]
     fixtures = fixtures_wrap["data"]
 
-    next_game = pick_next_erc_game(fixtures)
+    next_game = _next_erc_game_cached(str(FIXTURES_CACHE), fixtures_mtime)
     if not next_game:
         st.error("Kein nächstes ERC-Spiel im Spielplan gefunden (oder Parser greift nicht).")
         st.stop()
@@ -690,8 +1002,8 @@ else:
     away = next_game["away"]
     opponent = away if home == ERC_NAME else home
 
-    erc_row = find_team_row(table, ERC_NAME)
-    opp_row = find_team_row(table, opponent)
+    erc_row = _team_row_cached(str(TABLE_CACHE), table_mtime, ERC_NAME)
+    opp_row = _team_row_cached(str(TABLE_CACHE), table_mtime, opponent)
 
     tabs = st.tabs(["Heute", "Pre-Match Check", "Beobachtung", "Historie", "Wiki"])
 
@@ -701,24 +1013,9 @@ else:
         # =====================================
         st.subheader("Nächstes Spiel")
     
-        # HOME TEAM
-        with st.container(border=True):
-            col_h_logo, col_h_info = st.columns([1, 3])
-            with col_h_logo:
-                team_logo(home, width=80)
-            with col_h_info:
-                st.markdown(f"### {home}")
-                if home == ERC_NAME:
-                    st.caption("🏠 Heimspiel")
-                else:
-                    st.caption("✈️ Auswärts")
-            
-                # Stats inline
-                if erc_row and home == ERC_NAME:
-                    st.markdown(f"**Platz #{erc_row.get('#', '?')}** · {erc_row.get('P', '?')} Punkte · Tore {erc_row.get('GF', '?')}:{erc_row.get('GA', '?')}")
-                elif opp_row and home == opponent:
-                    st.markdown(f"**Platz #{opp_row.get('#', '?')}** · {opp_row.get('P', '?')} Punkte · Tore {opp_row.get('GF', '?')}:{opp_row.get('GA', '?')}")
-    
+        # HOME TEAM (row picked once instead of if/elif per stats line)
+        _render_team_card(home, erc_row if home == ERC_NAME else opp_row)
+
         # MATCH INFO
         st.markdown(
             f"**📅 {next_game.get('date')}** · "
@@ -728,23 +1025,8 @@ else:
         st.caption("Hauptrunde · DEL 2025/26")
     
         # AWAY TEAM
-        with st.container(border=True):
-            col_a_logo, col_a_info = st.columns([1, 3])
-            with col_a_logo:
-                team_logo(away, width=80)
-            with col_a_info:
-                st.markdown(f"### {away}")
-                if away == ERC_NAME:
-                    st.caption("🏠 Heimspiel")
-                else:
-                    st.caption("✈️ Auswärts")
-            
-                # Stats inline
-                if erc_row and away == ERC_NAME:
-                    st.markdown(f"**Platz #{erc_row.get('#', '?')}** · {erc_row.get('P', '?')} Punkte · Tore {erc_row.get('GF', '?')}:{erc_row.get('GA', '?')}")
-                elif opp_row and away == opponent:
-                    st.markdown(f"**Platz #{opp_row.get('#', '?')}** · {opp_row.get('P', '?')} Punkte · Tore {opp_row.get('GF', '?')}:{opp_row.get('GA', '?')}")
-    
+        _render_team_card(away, erc_row if away == ERC_NAME else opp_row)
+
         st.divider()
     
         # =====================================
@@ -752,28 +1034,9 @@ else:
         # =====================================
         if erc_row and opp_row:
             st.markdown("#### 📊 Direkter Vergleich")
-        
-            # Kompakte Darstellung als Tabelle
-            import pandas as pd
-            comparison_data = {
-                "Kategorie": ["Platz", "Punkte", "Tore für", "Tore gegen", "Differenz"],
-                "ERC": [
-                    f"#{erc_row.get('#', '?')}",
-                    erc_row.get('P', '?'),
-                    erc_row.get('GF', '?'),
-                    erc_row.get('GA', '?'),
-                    erc_row.get('GDIFF', '?')
-                ],
-                opponent: [
-                    f"#{opp_row.get('#', '?')}",
-                    opp_row.get('P', '?'),
-                    opp_row.get('GF', '?'),
-                    opp_row.get('GA', '?'),
-                    opp_row.get('GDIFF', '?')
-                ]
-            }
-        
-            df_comparison = pd.DataFrame(comparison_data)
+
+            # Kompakte Darstellung als Tabelle (cached per row contents)
+            df_comparison = _comparison_df(erc_row, opp_row, opponent)
             st.dataframe(df_comparison, use_container_width=True, hide_index=True)
     
         st.divider()
@@ -784,22 +1047,23 @@ else:
         st.subheader("📊 Last Five – Formkurve")
         st.caption("Letzte 5 Spiele mit Ergebnis. Quelle: Team-Übersichtsseiten.")
     
-        # Load recent games data
-        erc_short = TEAM_MAPPING.get(ERC_NAME, ERC_NAME.replace(" ", "_"))
-        erc_recent_cache = CACHE_DIR / f"recent_{erc_short.lower()}.json"
-        erc_recent = read_cache(erc_recent_cache)
-    
-        opp_short = TEAM_MAPPING.get(opponent, opponent.replace(" ", "_"))
-        opp_recent_cache = CACHE_DIR / f"recent_{opp_short.lower()}.json"
-        opp_recent = read_cache(opp_recent_cache)
-    
-        # Get last five for both teams (using bridge function)
-        erc_last_five = get_last_five_from_recent(erc_recent.get("data", {}) if erc_recent else {}, max_games=5)
-        opp_last_five = get_last_five_from_recent(opp_recent.get("data", {}) if opp_recent else {}, max_games=5)
+        # Load recent games data (paths precomputed, reads memoized per
+        # snapshot, existence answered by the directory scan above)
+        erc_mtime = cache_mtimes.get(ERC_RECENT_CACHE.name)
+        erc_recent = _read_cache_cached(str(ERC_RECENT_CACHE), erc_mtime) if erc_mtime else None
+
+        opp_recent_cache = _recent_cache_path(opponent)
+        opp_mtime = cache_mtimes.get(opp_recent_cache.name)
+        opp_recent = _read_cache_cached(str(opp_recent_cache), opp_mtime) if opp_mtime else None
     
-        # Calculate form summaries
-        erc_form = calculate_form_summary(erc_last_five)
-        opp_form = calculate_form_summary(opp_last_five)
+        # Last five + form summaries per team, memoized per cache snapshot
+        empty_form = ([], calculate_form_summary([]))
+        erc_last_five, erc_form = (
+            _form_cached(str(ERC_RECENT_CACHE), erc_mtime) if erc_mtime else empty_form
+        )
+        opp_last_five, opp_form = (
+            _form_cached(str(opp_recent_cache), opp_mtime) if opp_mtime else empty_form
+        )
     
         # Form comparison header
         if erc_last_five and opp_last_five:
@@ -822,73 +1086,41 @@ else:
             if not erc_last_five:
                 st.info("Noch keine Daten. Klicke auf 'DEL-Daten aktualisieren'")
             else:
-                import pandas as pd
-                df = pd.DataFrame(erc_last_five)
-                # Format for display - adjusted to available columns
-                display_df = df[["date", "score", "result"]].copy()
-                display_df.columns = ["Datum", "Ergebnis", "Typ"]
-            
-                # Optional: Add color coding based on result
-                def style_result(val):
-                    if val in ["W", "OTW"]:
-                        return "background-color: #d4edda; color: #155724"
-                    elif val in ["L", "OTL"]:
-                        return "background-color: #f8d7da; color: #721c24"
-                    return ""
-            
-                st.dataframe(
-                    display_df.style.applymap(style_result, subset=["Typ"]),
-                    use_container_width=True,
-                    hide_index=True,
-                    height=220
-                )
+                _render_last_five(erc_last_five)
     
         with col_opp:
             st.markdown(f"**{opponent}**")
             if not opp_last_five:
                 st.info("Noch keine Daten. Klicke auf 'DEL-Daten aktualisieren'")
             else:
-                import pandas as pd
-                df = pd.DataFrame(opp_last_five)
-                display_df = df[["date", "score", "result"]].copy()
-                display_df.columns = ["Datum", "Ergebnis", "Typ"]
-            
-                def style_result(val):
-                    if val in ["W", "OTW"]:
-                        return "background-color: #d4edda; color: #155724"
-                    elif val in ["L", "OTL"]:
-                        return "background-color: #f8d7da; color: #721c24"
-                    return ""
-            
-                st.dataframe(
-                    display_df.style.applymap(style_result, subset=["Typ"]),
-                    use_container_width=True,
-                    hide_index=True,
-                    height=220
-                )
+                _render_last_five(opp_last_five)
     
         st.divider()
         st.subheader("Cache-Status")
         st.write(f"- Tabelle: **{table_wrap.get('updated_at','?')}**")
         st.write(f"- Spielplan: **{fixtures_wrap.get('updated_at','?')}**")
     
-        # Check if recent caches exist
-        erc_short = TEAM_MAPPING.get(ERC_NAME, ERC_NAME.replace(" ", "_"))
-        erc_recent_cache = CACHE_DIR / f"recent_{erc_short.lower()}.json"
-        if erc_recent_cache.exists():
-            erc_recent_data = read_cache(erc_recent_cache)
-            if erc_recent_data:
-                st.write(f"- Recent ERC: **{erc_recent_data.get('updated_at','?')}**")
-    
-        opp_short = TEAM_MAPPING.get(opponent, opponent.replace(" ", "_"))
-        opp_recent_cache = CACHE_DIR / f"recent_{opp_short.lower()}.json"
-        if opp_recent_cache.exists():
-            opp_recent_data = read_cache(opp_recent_cache)
-            if opp_recent_data:
-                st.write(f"- Recent {opponent}: **{opp_recent_data.get('updated_at','?')}**")
+        # Recent caches were already read above; reuse the wrappers
+        if erc_recent:
+            st.write(f"- Recent ERC: **{erc_recent.get('updated_at','?')}**")
 
+        if opp_recent:
+            st.write(f"- Recent {opponent}: **{opp_recent.get('updated_at','?')}**")
 
-    with tabs[1]:
+
+    # Mood sliders as data: one loop registers the widgets, and the payload
+    # keys live next to their labels instead of in four parallel variables
+    _MOOD_FIELDS = (
+        ("Nervös?", "nervous", 3),
+        ("Vertrauen ins Team?", "confidence_team", 4),
+        ("Erwartung (wie gut wird's)?", "expectation", 4),
+        ("Grundstimmung?", "mood", 4),
+    )
+
+    # Fragment: slider moves and toggles in here rerun only this block,
+    # not the whole script (table/fixtures/Historie stay untouched)
+    @st.fragment
+    def prematch_fragment():
         st.subheader("Pre-Match Check")
         st.caption("Skala 1–6. 1 = low, 6 = high. Kurz halten, damit er's macht.")
 
@@ -896,23 +1128,17 @@ else:
         mode = st.toggle("Erweiterter Modus (Taktik & Analyse)", value=False)
         mode_value = "nerd" if mode else "simple"
 
-        # Load wiki for inline hints
-        wiki_path = DATA_DIR / "wiki_terms.json"
-        wiki_data = load_json(wiki_path) if wiki_path.exists() else {}
+        # Load wiki for inline hints (parsed once per file snapshot)
+        wiki_data, wiki_terms_sorted, _ = get_wiki(DATA_DIR / "wiki_terms.json")
 
         with st.form("prematch"):
             # 1. Pre-Match Mood
             with st.container(border=True):
                 st.markdown("#### 📊 Pre-Match Mood")
-                c1, c2, c3, c4 = st.columns(4)
-                with c1:
-                    nervous = st.slider("Nervös?", 1, 6, 3)
-                with c2:
-                    confidence = st.slider("Vertrauen ins Team?", 1, 6, 4)
-                with c3:
-                    expectation = st.slider("Erwartung (wie gut wird's)?", 1, 6, 4)
-                with c4:
-                    mood = st.slider("Grundstimmung?", 1, 6, 4)
+                ratings = {}
+                for col, (label, key, default) in zip(st.columns(4), _MOOD_FIELDS):
+                    with col:
+                        ratings[key] = st.slider(label, 1, 6, default)
 
             # 2. Tipp & Erwartung
             with st.container(border=True):
@@ -925,7 +1151,7 @@ else:
                 with st.container(border=True):
                     st.markdown("#### 🔍 Beobachtungs-Fokus")
                     # Lade Optionen dynamisch aus Wiki
-                    focus_options = sorted(wiki_data.keys()) if wiki_data else []
+                    focus_options = wiki_terms_sorted
                     if not focus_options:
                         st.info("Wiki-Begriffe noch nicht verfügbar. Erstelle data/wiki_terms.json")
                     else:
@@ -968,12 +1194,7 @@ else:
                     "away": away,
                     "erc": ERC_NAME,
                 },
-                "ratings": {
-                    "nervous": nervous,
-                    "confidence_team": confidence,
-                    "expectation": expectation,
-                    "mood": mood,
-                },
+                "ratings": ratings,
                 "tip": tip,
                 "focus_tags": focus_tags,
                 "notes": {
@@ -984,6 +1205,9 @@ else:
             path = save_submission(SUBMISSIONS_DIR, payload)
             st.success(f"Gespeichert: {path.name}")
 
+    with tabs[1]:
+        prematch_fragment()
+
 
     with tabs[2]:
         # =====================================
@@ -1009,7 +1233,7 @@ else:
             st.markdown("### Frage 1: Center-Position in der DZ")
             center_pos = st.radio(
                 "Wo war der Center defensiv meistens positioniert?",
-                ["Low – tief vor dem Slot", "Middle – Slot / Hashmarks", "High – oberhalb der Kreise / Richtung Blaue"],
+                list(_CENTER_OPTIONS),
                 key=f"center_pos_{period}"
             )
             st.caption("ℹ️ *Der Center ist der Pivot zwischen Slot-Schutz und erstem Outlet-Pass.*")
@@ -1038,7 +1262,7 @@ else:
             st.markdown("### Frage 3: Breakout-Qualität")
             breakout = st.radio(
                 "Wie kam ERC meist aus der eigenen Zone?",
-                ["Sauber – kontrollierter Aufbau", "Gemischt – mal Kontrolle, mal Chaos", "Chaotisch – Blind Clears, Icing-Gefahr"],
+                list(_BREAKOUT_OPTIONS),
                 key=f"breakout_{period}"
             )
             st.caption("ℹ️ *Breakout-Probleme zeigen sich zuerst beim Center-Support.*")
@@ -1062,8 +1286,8 @@ else:
     
         if submitted:
             # Parse answers
-            center_parsed = center_pos.split(" – ")[0].lower()
-            breakout_parsed = breakout.split(" – ")[0].lower()
+            center_parsed = _CENTER_OPTIONS[center_pos]
+            breakout_parsed = _BREAKOUT_OPTIONS[breakout]
         
             # Build observation object
             observation = {
@@ -1086,8 +1310,6 @@ else:
             }
         
             # Save to combined JSON
-            from pathlib import Path
-            import json
             obs_dir = DATA_DIR / "observations"
             filepath = save_observation(obs_dir, observation)
         
@@ -1099,73 +1321,43 @@ else:
             st.divider()
             st.markdown("### 🔎 Automatische Auswertung")
         
-            # Analyse-Logik
-            analysis = []
-            learning_task = ""
-        
-            if center_parsed == "high" and triangles <= 2:
-                analysis.append("**ERC verliert Struktur zwischen Slot und Blaue** – Dreiecke reißen früh.")
-                learning_task = "Achte darauf, ob der Center früher absinkt, sobald der Gegner Druck aufbaut."
-            elif center_parsed == "low" and breakout_parsed == "chaotisch":
-                analysis.append("**Center steht zu tief** – fehlende Outlet-Option führt zu Blind Clears.")
-                learning_task = "Beobachte, ob der Center rechtzeitig nach oben kommt, um den ersten Pass anzubieten."
-            elif triangles >= 4 and breakout_parsed == "sauber":
-                analysis.append("**Starke Struktur!** Dreiecke stabil, Breakouts kontrolliert.")
-                learning_task = "Achte darauf, wie lange diese Struktur unter Druck hält."
-            elif breakout_parsed == "gemischt":
-                analysis.append("**Inkonsistenz** – mal funktioniert's, mal nicht.")
-                learning_task = "Versuche zu erkennen, wann die Dreiecke zusammenbrechen (Forechecking-Druck? Tempo?)."
-            else:
-                analysis.append("**Solide Basisarbeit** – Center und Dreiecke arbeiten zusammen.")
-                learning_task = "Beobachte, wie sich das unter zunehmendem Druck entwickelt."
-        
+            # Analyse-Logik: first matching rule from the table
+            analysis, learning_task = next(
+                (a, task)
+                for pred, a, task in _ANALYSIS_RULES
+                if pred(center_parsed, triangles, breakout_parsed)
+            )
+
             # Display
-            for a in analysis:
-                st.markdown(a)
+            st.markdown(analysis)
         
             st.divider()
             st.markdown("### 🎯 Lernauftrag für nächstes Drittel")
             st.info(learning_task)
 
 
-    with tabs[3]:
+    @st.fragment
+    def historie_fragment():
         # =====================================
         # HISTORIE: Schöne Ansicht statt JSON-Dump
         # =====================================
         st.subheader("📚 Historie")
         st.caption("Einträge durchsuchen und anzeigen lassen.")
     
-        # Load data
-        submissions = load_all_submissions(SUBMISSIONS_DIR)
-        observations = load_all_observations(DATA_DIR / "observations")
-    
-        if not submissions and not observations:
+        # Load data. Pre-Match uses only the summary index here; the full
+        # JSON is parsed lazily once a game is picked. The dropdown structure
+        # is cached per directory snapshot, so a dropdown change doesn't
+        # re-walk the entries.
+        obs_dir = DATA_DIR / "observations"
+        game_options, keys_by_type, labels_by_type = _build_game_options(
+            tuple(sorted(_dir_mtimes(SUBMISSIONS_DIR).items())),
+            tuple(sorted(_dir_mtimes(obs_dir).items())),
+        )
+
+        if not game_options:
             st.info("Noch keine Einträge vorhanden.")
             st.stop()
-    
-        # Build game options
-        # Use a composite key (type + game_key) so Pre-Match and Beobachtung for
-        # dasselbe Spiel nicht kollidieren. Vorher wurde Beobachtung vom gleichen
-        # Spiel durch das Pre-Match-Entry überschrieben und tauchte im Dropdown
-        # nicht auf.
-        game_options = {}
-
-        # Add Pre-Match games
-        for sub in submissions:
-            game_key = get_game_key(sub, "Pre-Match")
-            composite_key = f"Pre-Match__{game_key}"
-            if composite_key not in game_options:
-                game_options[composite_key] = {"type": "Pre-Match", "game_key": game_key, "entries": []}
-            game_options[composite_key]["entries"].append(sub)
-
-        # Add Beobachtung games (now each entry contains all periods)
-        for obs in observations:
-            game_key = get_game_key(obs, "Beobachtung")
-            composite_key = f"Beobachtung__{game_key}"
-            if composite_key not in game_options:
-                game_options[composite_key] = {"type": "Beobachtung", "game_key": game_key, "entries": []}
-            game_options[composite_key]["entries"].append(obs)
-    
+
         # Dropdowns
         col1, col2, col3 = st.columns(3)
     
@@ -1178,13 +1370,13 @@ else:
             select_type = st.selectbox("📋 Typ", type_options, index=0)
     
         with col3:
-            # Filter games by type
-            available_games = [k for k, v in game_options.items() if v["type"] == select_type]
+            # Per-type key/label lists were filled during the cached build
+            available_games = keys_by_type[select_type]
             if not available_games:
                 st.warning(f"Keine {select_type} Einträge gefunden.")
                 st.stop()
-        
-            game_display_options = [format_game_display(game_options[k]["game_key"]) for k in available_games]
+
+            game_display_options = labels_by_type[select_type]
             select_game_idx = st.selectbox("🏒 Spiel", range(len(game_display_options)), format_func=lambda i: game_display_options[i])
             selected_game_key = available_games[select_game_idx]
     
@@ -1202,17 +1394,31 @@ else:
     
         # Since we keep only latest per user+game+type, there should be only one entry
         selected_entry = entries[0]
-    
+
+        # Pre-Match entries are index rows; parse the picked file now
+        if select_type == "Pre-Match":
+            file_path = SUBMISSIONS_DIR / selected_entry["filename"]
+            try:
+                stat = file_path.stat()
+                selected_entry = _load_one(str(file_path), stat.st_mtime_ns, stat.st_size)
+            except FileNotFoundError:
+                st.warning("Eintrag wurde zwischenzeitlich gelöscht.")
+                st.stop()
+
         st.divider()
-    
+
         # Display the entry beautifully
         if select_type == "Pre-Match":
             display_pre_match_entry(selected_entry)
         else:
             display_observation_entry(selected_entry)
 
+    with tabs[3]:
+        historie_fragment()
 
-    with tabs[4]:
+
+    @st.fragment
+    def wiki_fragment():
         # =====================================
         # WIKI: Taktik-Glossar
         # =====================================
@@ -1220,32 +1426,33 @@ else:
         st.caption("Begriffe und Konzepte aus dem Taktik-Seminar. Kompakt und durchsuchbar.")
     
         wiki_path = DATA_DIR / "wiki_terms.json"
-    
+
         if not wiki_path.exists():
             st.warning("Wiki noch nicht angelegt. Erstelle `data/wiki_terms.json`")
         else:
-            wiki_data = load_json(wiki_path)
-        
+            wiki_data, wiki_terms_sorted, wiki_lower_index = get_wiki(wiki_path)
+
             if not wiki_data:
                 st.info("Wiki ist leer.")
             else:
                 # Search field
                 search = st.text_input("🔍 Begriff suchen", placeholder="z.B. Dreieck, Center, Forecheck...")
-            
-                # Filter terms
-                terms = wiki_data.keys()
+
+                # Filter against the precomputed lowercased index so no
+                # .lower() calls run per term per keystroke
                 if search:
-                    terms = [t for t in terms if search.lower() in t.lower()]
+                    needle = search.lower()
+                    terms = [orig for low, orig in wiki_lower_index if needle in low]
                 else:
-                    terms = list(terms)
-            
+                    terms = wiki_terms_sorted
+
                 if not terms:
                     st.info("Keine Treffer.")
                 else:
                     st.caption(f"{len(terms)} Begriff(e) gefunden")
-                
+
                     # Display terms
-                    for term_name in sorted(terms):
+                    for term_name in terms:
                         term = wiki_data[term_name]
                         with st.expander(f"📖 {term_name}", expanded=False):
                             st.markdown(f"**{term.get('short', '')}**")
@@ -1256,4 +1463,7 @@ else:
                             if "watch" in term and term["watch"]:
                                 st.markdown("**Worauf achten:**")
                                 for item in term["watch"]:
-                                    st.markdown(f"- {item}")
\ No newline at end of file
+                                    st.markdown(f"- {item}")
+
+    with tabs[4]:
+        wiki_fragment()
\ No newline at end of file
@@ -3,9 +3,12 @@
 
 import json
 import re
-import requests
 from pathlib import Path
 
+from bs4 import BeautifulSoup
+
+from del_fetch import _http_get
+
 # Check current cached data
 cache_file = Path("data/cache/recent_ing.json")
 if cache_file.exists():
@@ -22,32 +25,29 @@ if cache_file.exists():
 # Fetch raw HTML and show structure
 print("\n\n=== RAW HTML STRUCTURE ===")
 url = "https://www.penny-del.org/teams/erc-ingolstadt/uebersicht"
-headers = {'User-Agent': 'matchhub/1.0'}
-r = requests.get(url, headers=headers, timeout=25)
-html = r.text
+html = _http_get(url)
 
 # Find the section with results
-# Look for "Letzte Ergebnisse" or similar
+# Look for "Letzte Ergebnisse" or similar. A real HTML parse instead of
+# .*?-DOTALL regexes over the whole page, which backtrack badly when the
+# date is missing.
 if "Letzte Ergebnisse" in html or "letzte-ergebnisse" in html:
-    # Extract the relevant table section
-    pattern = r'<table[^>]*>.*?28\.12\.2025.*?</table>'
-    match = re.search(pattern, html, re.DOTALL | re.IGNORECASE)
-    if match:
-        table_html = match.group(0)
+    soup = BeautifulSoup(html, "lxml")
+
+    table = next((t for t in soup.find_all("table") if "28.12.2025" in t.get_text()), None)
+    if table is not None:
         print("\nTable with 28.12.2025:")
-        print(table_html[:1000])
+        print(str(table)[:1000])
     else:
-        # Try to find any table row with that date
-        pattern = r'<tr[^>]*>.*?28\.12\.2025.*?</tr>'
-        match = re.search(pattern, html, re.DOTALL | re.IGNORECASE)
-        if match:
+        row = next((tr for tr in soup.find_all("tr") if "28.12.2025" in tr.get_text()), None)
+        if row is not None:
             print("\nRow with 28.12.2025:")
-            print(match.group(0))
+            print(str(row))
         else:
             print("\nCould not find 28.12.2025 in HTML")
-            # Show first few table rows
-            pattern = r'<tr[^>]*>.*?\d{2}\.\d{2}\.\d{4}.*?</tr>'
-            matches = list(re.finditer(pattern, html, re.DOTALL | re.IGNORECASE))[:3]
-            for i, m in enumerate(matches):
+            # Show first few table rows that carry a date
+            date_re = re.compile(r"\d{2}\.\d{2}\.\d{4}")
+            dated_rows = [tr for tr in soup.find_all("tr") if date_re.search(tr.get_text())][:3]
+            for i, tr in enumerate(dated_rows):
                 print(f"\n--- Row {i+1} ---")
-                print(m.group(0)[:500])
+                print(str(tr)[:500])
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import hashlib
 import json
 import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, date
 from pathlib import Path
@@ -9,9 +11,27 @@ from typing import Any, Dict, List, Optional, Tuple
 
 import pandas as pd
 import requests
-from dateutil import tz
+from bs4 import BeautifulSoup, SoupStrainer
+from zoneinfo import ZoneInfo
 
-BERLIN = tz.gettz("Europe/Berlin")
+try:
+    import orjson
+
+    def _loads(data: bytes) -> Any:
+        return orjson.loads(data)
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:  # pragma: no cover - orjson is optional
+
+    def _loads(data: bytes) -> Any:
+        return json.loads(data)
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+BERLIN = ZoneInfo("Europe/Berlin")
 
 TABLE_URL = "https://www.penny-del.org/statistik/saison-2025-26/hauptrunde/tabelle"
 FIXTURES_URL = "https://www.penny-del.org/statistik/saison-2025-26/hauptrunde/spielplan"
@@ -54,52 +74,124 @@ TEAM_SLUG_MAPPING = {
 }
 
 
+# Only table rows are of interest on the team pages; everything else
+# stays raw lxml and never becomes a BeautifulSoup node
+_TR_STRAINER = SoupStrainer("tr")
+
+# Compiled once at import; the parse loops hit these per cell/row
+_WS_RE = re.compile(r"\s+")
+_TIME_RE = re.compile(r"^\d{2}:\d{2}$")
+# Score plus optional OT/SO suffix in one scan: groups 3/4 carry the
+# "(OT)"/"(SO)" respectively "n.V."/"n.P." marker when the game went long
+_SCORE_RE = re.compile(r"(\d+)\s*-\s*(\d+)(?:\s*\((OT|SO)\)|\s*(n\.V\.|n\.P\.))?")
+
+
 @dataclass(frozen=True)
 class CacheWrite:
     path: Path
     updated_at: str
 
 
-def _http_get(url: str, timeout: int = 25) -> str:
-    headers = {
+# One Session for all fetches: urllib3 keeps the TLS connection to
+# www.penny-del.org alive, so only the first request pays the handshake
+_SESSION = requests.Session()
+_SESSION.headers.update(
+    {
         "User-Agent": "matchhub/1.0 (private tool)",
         "Accept-Language": "de-DE,de;q=0.9,en;q=0.8",
     }
-    r = requests.get(url, headers=headers, timeout=timeout)
+)
+_SESSION.mount("https://", requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
+
+def _http_get(url: str, timeout: int = 25) -> str:
+    r = _SESSION.get(url, timeout=timeout)
     r.raise_for_status()
     return r.text
 
 
+def _conditional_get(
+    url: str, cache_path: Path, timeout: int = 25
+) -> Tuple[Optional[str], Dict[str, str], Optional[Dict[str, Any]]]:
+    """
+    GET with If-None-Match/If-Modified-Since taken from the existing cache.
+
+    Returns (html, validators, cached_wrap). On 304 Not Modified — or a
+    200 whose body hashes identically to the cached fetch — html is None
+    and cached_wrap holds the previous cache content, so callers can skip
+    the whole HTML re-parse. The content hash covers servers that send no
+    usable validators.
+    """
+    cached = read_cache(cache_path)
+    headers = {}
+    old = (cached or {}).get("http") or {}
+    if old.get("etag"):
+        headers["If-None-Match"] = old["etag"]
+    if old.get("last_modified"):
+        headers["If-Modified-Since"] = old["last_modified"]
+
+    r = _SESSION.get(url, headers=headers, timeout=timeout)
+    if r.status_code == 304 and cached is not None:
+        return None, old, cached
+    r.raise_for_status()
+
+    validators = {"content_sha256": hashlib.sha256(r.content).hexdigest()}
+    if r.headers.get("ETag"):
+        validators["etag"] = r.headers["ETag"]
+    if r.headers.get("Last-Modified"):
+        validators["last_modified"] = r.headers["Last-Modified"]
+
+    if cached is not None and old.get("content_sha256") == validators["content_sha256"]:
+        # Full response, same bytes: hashing is sub-ms, the parse is not
+        return None, validators, cached
+    return r.text, validators, cached
+
+
 def _ensure_dir(p: Path) -> None:
     p.mkdir(parents=True, exist_ok=True)
 
 
-def _wrap(updated_at: str, data: Any) -> Dict[str, Any]:
-    return {"updated_at": updated_at, "data": data}
+def _wrap(updated_at: str, data: Any, http: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+    wrap = {"updated_at": updated_at, "data": data}
+    if http:
+        wrap["http"] = http
+    return wrap
 
 
-def write_cache(path: Path, data: Any) -> CacheWrite:
+def write_cache(path: Path, data: Any, http: Optional[Dict[str, str]] = None) -> CacheWrite:
     _ensure_dir(path.parent)
     updated_at = datetime.now(tz=BERLIN).isoformat(timespec="seconds")
-    path.write_text(json.dumps(_wrap(updated_at, data), ensure_ascii=False, indent=2), encoding="utf-8")
+    path.write_bytes(_dumps(_wrap(updated_at, data, http)))
+    return CacheWrite(path=path, updated_at=updated_at)
+
+
+def _touch_cache(path: Path, cached: Dict[str, Any]) -> CacheWrite:
+    """Re-stamp an unchanged cache (304 path): bump updated_at, keep data."""
+    updated_at = datetime.now(tz=BERLIN).isoformat(timespec="seconds")
+    cached["updated_at"] = updated_at
+    path.write_bytes(_dumps(cached))
     return CacheWrite(path=path, updated_at=updated_at)
 
 
 def read_cache(path: Path) -> Optional[Dict[str, Any]]:
     if not path.exists():
         return None
-    return json.loads(path.read_text(encoding="utf-8"))
+    return _loads(path.read_bytes())
 
 
 def _clean(s: Any) -> str:
     x = str(s).strip()
-    x = re.sub(r"\s+", " ", x)
+    x = _WS_RE.sub(" ", x)
     return x
 
 
 def fetch_table(cache_dir: Path) -> CacheWrite:
-    html = _http_get(TABLE_URL)
-    tables = pd.read_html(html)
+    cache_path = cache_dir / "del_table.json"
+    html, validators, cached = _conditional_get(TABLE_URL, cache_path)
+    if html is None:
+        # 304: upstream unchanged, skip the re-parse
+        return _touch_cache(cache_path, cached)
+    tables = pd.read_html(html, flavor="lxml")
     if not tables:
         raise RuntimeError("Keine Tabelle auf der DEL-Tabelle-Seite gefunden.")
     df = tables[0].copy()
@@ -107,7 +199,7 @@ def fetch_table(cache_dir: Path) -> CacheWrite:
     if "Team" in df.columns:
         df["Team"] = df["Team"].map(_clean)
     records = df.to_dict(orient="records")
-    return write_cache(cache_dir / "del_table.json", records)
+    return write_cache(cache_path, records, http=validators)
 
 
 def _parse_date_de(cell: str) -> Optional[date]:
@@ -115,26 +207,35 @@ def _parse_date_de(cell: str) -> Optional[date]:
     # Beispiele: "Freitag, 02.01.2026" oder "02.01.2026"
     if "," in s:
         s = s.split(",", 1)[1].strip()
-    try:
-        return datetime.strptime(s, "%d.%m.%Y").date()
-    except Exception:
-        return None
+    # dd.mm.yyyy per Slicing; strptime ist pure-Python und auf diesem
+    # festen Format rund eine Größenordnung langsamer
+    if len(s) == 10 and s[2] == "." and s[5] == ".":
+        try:
+            return date(int(s[6:10]), int(s[3:5]), int(s[0:2]))
+        except ValueError:
+            return None
+    return None
 
 
 def _parse_time(cell: str) -> Optional[str]:
     s = _clean(cell)
-    if re.match(r"^\d{2}:\d{2}$", s):
+    if _TIME_RE.match(s):
         return s
     return None
 
 
 def fetch_fixtures(cache_dir: Path) -> CacheWrite:
-    html = _http_get(FIXTURES_URL)
-    tables = pd.read_html(html)
+    cache_path = cache_dir / "del_fixtures.json"
+    html, validators, cached = _conditional_get(FIXTURES_URL, cache_path)
+    if html is None:
+        # 304: upstream unchanged, skip the re-parse
+        return _touch_cache(cache_path, cached)
+    tables = pd.read_html(html, flavor="lxml")
     if not tables:
         raise RuntimeError("Keine Tabellen auf der DEL-Spielplan-Seite gefunden.")
 
     games: List[Dict[str, Any]] = []
+    seen: set = set()
     for df in tables:
         df = df.copy()
         df.columns = [str(c).strip() for c in df.columns]
@@ -149,31 +250,50 @@ def fetch_fixtures(cache_dir: Path) -> CacheWrite:
         if not (col_date and (col_home or col_away)):
             continue
 
-        for _, row in df.iterrows():
-            d = _parse_date_de(row[col_date]) if col_date else None
-            t = _parse_time(row[col_time]) if col_time else None
-            md = None
-            if col_md is not None:
-                try:
-                    md = int(str(row[col_md]).strip())
-                except Exception:
-                    md = None
+        # Datum/Zeit/Spieltag vektorisiert pro Spalte parsen statt pro
+        # Zeile; nur der Zusammenbau der Dicts bleibt eine Python-Schleife
+        date_clean = df[col_date].astype(str).map(_clean).str.split(",").str[-1].str.strip()
+        dts = pd.to_datetime(date_clean, format="%d.%m.%Y", errors="coerce")
 
-            home = _clean(row[col_home]) if col_home else None
-            away = _clean(row[col_away]) if col_away else None
+        if col_time is not None:
+            times_raw = df[col_time].astype(str).map(_clean)
+            times = times_raw.where(times_raw.str.match(_TIME_RE))
+        else:
+            times = pd.Series(None, index=df.index, dtype=object)
+
+        if col_md is not None:
+            mds = pd.to_numeric(df[col_md], errors="coerce")
+        else:
+            mds = pd.Series(float("nan"), index=df.index)
+
+        homes = df[col_home].astype(str).map(_clean) if col_home else pd.Series("", index=df.index)
+        aways = df[col_away].astype(str).map(_clean) if col_away else pd.Series("", index=df.index)
+
+        # Minimalfilter: wir wollen nur Zeilen, die nach Spiel aussehen
+        valid = dts.notna() & homes.ne("") & aways.ne("")
+
+        for d_ts, t, md, home, away in zip(
+            dts[valid], times[valid], mds[valid], homes[valid], aways[valid]
+        ):
+            d_iso = d_ts.date().isoformat()
+            t = t if pd.notna(t) else None
+            md = int(md) if pd.notna(md) else None
 
             faceoff = None
-            if d and t:
-                dt = datetime.strptime(f"{d.isoformat()} {t}", "%Y-%m-%d %H:%M").replace(tzinfo=BERLIN)
+            if t:
+                dt = datetime.fromisoformat(f"{d_iso} {t}").replace(tzinfo=BERLIN)
                 faceoff = dt.isoformat(timespec="minutes")
 
-            # Minimalfilter: wir wollen nur Zeilen, die nach Spiel aussehen
-            if not (home and away and d):
+            # Dedupe inline: Duplikate sind identische Zeilen, also reicht
+            # das erste Vorkommen
+            key = (d_iso, t, home, away)
+            if key in seen:
                 continue
+            seen.add(key)
 
             games.append(
                 {
-                    "date": d.isoformat(),
+                    "date": d_iso,
                     "time": t,
                     "matchday": md,
                     "home": home,
@@ -182,46 +302,48 @@ def fetch_fixtures(cache_dir: Path) -> CacheWrite:
                 }
             )
 
-    # Dedupe
-    uniq = {}
-    for g in games:
-        key = (g["date"], g.get("time"), g["home"], g["away"])
-        uniq[key] = g
-    games = list(uniq.values())
-
-    return write_cache(cache_dir / "del_fixtures.json", games)
+    return write_cache(cache_path, games, http=validators)
 
 
 def pick_next_erc_game(fixtures: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    # Nur das früheste Spiel wird gebraucht: ein Minimum-Durchlauf statt
+    # Liste aufbauen und sortieren
     today = datetime.now(tz=BERLIN).date()
-    upcoming: List[Tuple[date, str, Dict[str, Any]]] = []
+    best: Optional[Tuple[Tuple[date, str], Dict[str, Any]]] = None
     for g in fixtures:
         try:
-            d = datetime.strptime(g["date"], "%Y-%m-%d").date()
-        except Exception:
+            # C-implementiert, deutlich schneller als strptime pro Spiel
+            d = date.fromisoformat(g["date"])
+        except (KeyError, TypeError, ValueError):
             continue
         if d < today:
             continue
         if g.get("home") == ERC_NAME or g.get("away") == ERC_NAME:
-            upcoming.append((d, g.get("time") or "99:99", g))
-    upcoming.sort(key=lambda x: (x[0], x[1]))
-    return upcoming[0][2] if upcoming else None
+            key = (d, g.get("time") or "99:99")
+            if best is None or key < best[0]:
+                best = (key, g)
+    return best[1] if best else None
+
+
+def build_team_index(table: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """
+    Index {bereinigter Teamname: Zeile} über die Tabelle.
+
+    Wer mehrere Teams nachschlägt, baut den Index einmal und greift dann
+    per Hash zu, statt pro Lookup die Tabelle linear zu durchsuchen.
+    """
+    return {_clean(r.get("Team", "")): r for r in table}
 
 
 def find_team_row(table: List[Dict[str, Any]], team_name: str) -> Optional[Dict[str, Any]]:
-    # Erst direkt suchen
-    for r in table:
-        if _clean(r.get("Team", "")) == team_name:
-            return r
-    
-    # Falls nicht gefunden, versuche mit Mapping (voller Name -> Kürzel)
-    short_name = TEAM_MAPPING.get(team_name)
-    if short_name:
-        for r in table:
-            if _clean(r.get("Team", "")) == short_name:
-                return r
-    
-    return None
+    # Erst direkt suchen, dann über das Mapping (voller Name -> Kürzel)
+    by_team = build_team_index(table)
+    row = by_team.get(team_name)
+    if row is None:
+        short_name = TEAM_MAPPING.get(team_name)
+        if short_name:
+            row = by_team.get(short_name)
+    return row
 
 
 def fetch_team_recent_games(cache_dir: Path, team_name: str) -> CacheWrite:
@@ -240,124 +362,112 @@ def fetch_team_recent_games(cache_dir: Path, team_name: str) -> CacheWrite:
         raise ValueError(f"No slug mapping found for team: {team_name}")
     
     url = TEAM_BASE_URL.format(slug=slug)
-    html = _http_get(url)
-    
-    # Parse tables with pandas
-    tables = pd.read_html(html)
-    
+
+    # Cache with team-specific filename
+    short_name = TEAM_MAPPING.get(team_name, team_name.replace(" ", "_"))
+    cache_file = cache_dir / f"recent_{short_name.lower()}.json"
+
+    html, validators, cached = _conditional_get(url, cache_file)
+    if html is None:
+        # 304: upstream unchanged, skip the re-parse
+        return _touch_cache(cache_file, cached)
+
+    # One BeautifulSoup parse serves both the cell texts and the logo
+    # extraction; no second pd.read_html pass over the same HTML. Result
+    # rows are the ones carrying a team-result__date cell, in page order.
+    # The strainer keeps only <tr> subtrees, so the rest of the page is
+    # never wrapped in Python node objects.
+    soup = BeautifulSoup(html, 'lxml', parse_only=_TR_STRAINER)
+
     recent_games = []
-    for df in tables:
-        df = df.copy()
-        if len(df.columns) >= 3 and len(df) >= 5:
-            first_col = str(df.iloc[0, 0]).strip()
-            if re.match(r"\d{2}\.\d{2}\.\d{4}", first_col):
-                # Found the results table
-                for idx, row in df.iterrows():
-                    try:
-                        date_str = _clean(str(row.iloc[0]))
-                        score_str = _clean(str(row.iloc[1]))
-                        matchday_str = _clean(str(row.iloc[2])) if len(row) > 2 else None
-                        
-                        game_date = datetime.strptime(date_str, "%d.%m.%Y").date()
-                        
-                        # Parse score: "X - Y" or "X - Y (OT)" or "X - Y (SO)"
-                        score_match = re.match(r"(\d+)\s*-\s*(\d+)", score_str)
-                        if not score_match:
-                            continue
-                        
-                        home_score = int(score_match.group(1))
-                        away_score = int(score_match.group(2))
-                        
-                        is_ot = "(OT)" in score_str or "n.V." in score_str
-                        is_so = "(SO)" in score_str or "n.P." in score_str
-                        is_overtime = is_ot or is_so
-                        
-                        # Find the specific row in HTML using the EXACT date
-                        # Use BeautifulSoup for reliable parsing
-                        from bs4 import BeautifulSoup
-                        soup = BeautifulSoup(html, 'lxml')
-                        
-                        # Find the table
-                        table = None
-                        for t in soup.find_all('table'):
-                            if date_str in t.get_text():
-                                table = t
-                                break
-                        
-                        if not table:
-                            continue
-                        
-                        # Find the row with this exact date
-                        target_row = None
-                        for tr in table.find_all('tr'):
-                            date_cell = tr.find('td', class_='team-result__date')
-                            if date_cell and date_cell.get_text(strip=True) == date_str:
-                                target_row = tr
-                                break
-                        
-                        if not target_row:
-                            continue
-                        
-                        # Extract team logos from this specific row
-                        team_logos_imgs = target_row.find_all('figure', class_='team-meta__logo')
-                        if len(team_logos_imgs) < 2:
-                            continue
-                        
-                        team_names = []
-                        for fig in team_logos_imgs[:2]:
-                            img = fig.find('img')
-                            if img and img.get('alt'):
-                                team_names.append(img['alt'])
-                        
-                        if len(team_names) < 2:
-                            continue
-                        
-                        home_team = team_names[0]
-                        away_team = team_names[1]
-                        
-                        # Determine if our team is home or away
-                        is_home = (home_team == team_name)
-                        is_away = (away_team == team_name)
-                        
-                        if not (is_home or is_away):
-                            # Team name mismatch, skip
-                            continue
-                        
-                        # Calculate team scores from perspective
-                        team_score = home_score if is_home else away_score
-                        opponent_score = away_score if is_home else home_score
-                        
-                        # Determine result - use simple score comparison
-                        # Works for both regular and OT/SO games
-                        if team_score > opponent_score:
-                            result = "OTW" if is_overtime else "W"
-                        elif team_score < opponent_score:
-                            result = "OTL" if is_overtime else "L"
-                        else:
-                            result = "T"  # Shouldn't happen in DEL
-                        
-                        ot_so = "OT/SO" if is_overtime else ""
-                        
-                        matchday = None
-                        try:
-                            matchday = int(matchday_str) if matchday_str else None
-                        except:
-                            pass
-                        
-                        recent_games.append({
-                            "date": game_date.isoformat(),
-                            "score": score_str,
-                            "team_score": team_score,
-                            "opponent_score": opponent_score,
-                            "result": result,
-                            "ot_so": ot_so,
-                            "matchday": matchday,
-                        })
-                    except Exception:
-                        continue
-                
-                break  # Found the table, stop searching
-    
+    seen_dates = set()
+    for tr in soup.find_all('tr'):
+        date_cell = tr.find('td', class_='team-result__date')
+        if date_cell is None:
+            continue
+        try:
+            cells = [td.get_text(" ", strip=True) for td in tr.find_all('td')]
+            date_str = _clean(cells[0])
+            score_str = _clean(cells[1]) if len(cells) > 1 else ""
+            matchday_str = _clean(cells[2]) if len(cells) > 2 else None
+
+            if date_str in seen_dates:
+                continue
+
+            game_date = _parse_date_de(date_str)
+            if game_date is None:
+                continue
+
+            # Parse score: "X - Y" or "X - Y (OT)" or "X - Y (SO)"
+            score_match = _SCORE_RE.match(score_str)
+            if not score_match:
+                continue
+
+            home_score = int(score_match.group(1))
+            away_score = int(score_match.group(2))
+
+            # OT/SO marker came along in the same match
+            is_overtime = score_match.group(3) is not None or score_match.group(4) is not None
+
+            # Extract team logos from this specific row
+            team_logos_imgs = tr.find_all('figure', class_='team-meta__logo')
+            if len(team_logos_imgs) < 2:
+                continue
+
+            team_names = []
+            for fig in team_logos_imgs[:2]:
+                img = fig.find('img')
+                if img and img.get('alt'):
+                    team_names.append(img['alt'])
+
+            if len(team_names) < 2:
+                continue
+
+            home_team = team_names[0]
+            away_team = team_names[1]
+
+            # Determine if our team is home or away
+            is_home = (home_team == team_name)
+            is_away = (away_team == team_name)
+
+            if not (is_home or is_away):
+                # Team name mismatch, skip
+                continue
+
+            # Calculate team scores from perspective
+            team_score = home_score if is_home else away_score
+            opponent_score = away_score if is_home else home_score
+
+            # Determine result - use simple score comparison
+            # Works for both regular and OT/SO games
+            if team_score > opponent_score:
+                result = "OTW" if is_overtime else "W"
+            elif team_score < opponent_score:
+                result = "OTL" if is_overtime else "L"
+            else:
+                result = "T"  # Shouldn't happen in DEL
+
+            ot_so = "OT/SO" if is_overtime else ""
+
+            matchday = None
+            try:
+                matchday = int(matchday_str) if matchday_str else None
+            except:
+                pass
+
+            seen_dates.add(date_str)
+            recent_games.append({
+                "date": game_date.isoformat(),
+                "score": score_str,
+                "team_score": team_score,
+                "opponent_score": opponent_score,
+                "result": result,
+                "ot_so": ot_so,
+                "matchday": matchday,
+            })
+        except Exception:
+            continue
+
     # Calculate form from last games
     last_10_results = [g["result"] for g in recent_games[:10]]
     wins = last_10_results.count("W")
@@ -369,8 +479,22 @@ def fetch_team_recent_games(cache_dir: Path, team_name: str) -> CacheWrite:
         "recent_games": recent_games[:10],  # Keep last 10
     }
     
-    # Cache with team-specific filename
-    short_name = TEAM_MAPPING.get(team_name, team_name.replace(" ", "_"))
-    cache_file = cache_dir / f"recent_{short_name.lower()}.json"
-    return write_cache(cache_file, data)
+    return write_cache(cache_file, data, http=validators)
+
+
+def fetch_all_teams_recent_games(
+    cache_dir: Path, team_names: Optional[List[str]] = None
+) -> List[CacheWrite]:
+    """
+    Fetches recent games for several teams concurrently.
+
+    The per-team fetch is network-bound, so running the requests in
+    threads over the shared session collapses the total wall time from
+    the sum of the round-trips to roughly the slowest single one.
+    Defaults to all teams in TEAM_SLUG_MAPPING.
+    """
+    if team_names is None:
+        team_names = list(TEAM_SLUG_MAPPING)
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        return list(pool.map(lambda team: fetch_team_recent_games(cache_dir, team), team_names))
 
@@ -4,9 +4,9 @@ Generate hashed passwords for auth.yaml
 Run this once to set up passwords for martin and christoph
 """
 
-import streamlit_authenticator as stauth
+from concurrent.futures import ProcessPoolExecutor
 
-print("=== MatchHub Password Generator ===\n")
+import streamlit_authenticator as stauth
 
 # Generate hashed passwords
 passwords = {
@@ -14,14 +14,21 @@ passwords = {
     "christoph": "christoph123"
 }
 
-print("Kopiere diese Hashes in data/auth.yaml:\n")
 
-for username, password in passwords.items():
-    hashed = stauth.Hasher.hash(password)
-    print(f"{username}:")
-    print(f"  password: {hashed}")
-    print()
+if __name__ == "__main__":
+    print("=== MatchHub Password Generator ===\n")
+    print("Kopiere diese Hashes in data/auth.yaml:\n")
+
+    # bcrypt ist absichtlich langsam (~100 ms pro Hash) und CPU-gebunden;
+    # bei mehr Usern skaliert das über Prozesse statt seriell
+    with ProcessPoolExecutor() as pool:
+        hashes = pool.map(stauth.Hasher.hash, passwords.values())
+
+    for username, hashed in zip(passwords, hashes):
+        print(f"{username}:")
+        print(f"  password: {hashed}")
+        print()
 
-print("---")
-print("WICHTIG: Ändere die Passwörter in diesem Script vor dem Hashen!")
-print("Dann lösche dieses Script oder speichere es sicher.")
+    print("---")
+    print("WICHTIG: Ändere die Passwörter in diesem Script vor dem Hashen!")
+    print("Dann lösche dieses Script oder speichere es sicher.")
@@ -1,19 +1,104 @@
 from __future__ import annotations
 
 import json
+import os
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-from dateutil import tz
+from zoneinfo import ZoneInfo
 
-BERLIN = tz.gettz("Europe/Berlin")
+try:
+    import orjson
+
+    def _loads(data: bytes) -> Any:
+        return orjson.loads(data)
+
+    def _dumps(obj: Any, indent: bool = False) -> str:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(obj, option=option).decode()
+except ImportError:  # pragma: no cover - orjson is optional
+
+    def _loads(data: bytes) -> Any:
+        return json.loads(data)
+
+    def _dumps(obj: Any, indent: bool = False) -> str:
+        return json.dumps(obj, ensure_ascii=False, indent=2 if indent else None)
+
+
+BERLIN = ZoneInfo("Europe/Berlin")
+
+# Submissions are machine-read; write them compact. Set MATCHHUB_PRETTY=1
+# to get indented files for manual inspection (same switch as the academy
+# session files).
+_PRETTY = os.environ.get("MATCHHUB_PRETTY") == "1"
 
 
 def ensure_dir(p: Path) -> None:
     p.mkdir(parents=True, exist_ok=True)
 
 
+# Summary index: one small file with the metadata needed for listing and
+# dedup, so the full submission files are only parsed on demand.
+_INDEX_NAME = "_index.json"
+
+
+def _index_row(payload: Dict[str, Any], filename: str) -> Dict[str, Any]:
+    game = payload.get("game") or {}
+    return {
+        "filename": filename,
+        "user": payload.get("user", "unknown"),
+        "date": game.get("date", "unknown"),
+        "home": game.get("home", "unknown"),
+        "away": game.get("away", "unknown"),
+        "timestamp": payload.get("timestamp") or payload.get("submitted_at") or "",
+    }
+
+
+def _load_index(base_dir: Path) -> Dict[str, Any]:
+    path = base_dir / _INDEX_NAME
+    if not path.exists():
+        return {}
+    try:
+        return _loads(path.read_bytes())
+    except Exception:
+        return {}
+
+
+def _write_index(base_dir: Path, index: Dict[str, Any]) -> None:
+    path = base_dir / _INDEX_NAME
+    tmp = path.with_suffix(".json.tmp")
+    tmp.write_text(_dumps(index), encoding="utf-8")
+    tmp.replace(path)
+
+
+def _rebuild_index(base_dir: Path) -> Dict[str, Any]:
+    index: Dict[str, Any] = {}
+    for path in base_dir.glob("*.json"):
+        if path.name == _INDEX_NAME:
+            continue
+        try:
+            payload = load_json(path)
+        except Exception:
+            continue
+        if payload:
+            index[path.name] = _index_row(payload, path.name)
+    _write_index(base_dir, index)
+    return index
+
+
+def submission_index(base_dir: Path) -> Dict[str, Any]:
+    """Summary rows per submission file, rebuilt when files were added or
+    removed behind the index's back."""
+    if not base_dir.exists():
+        return {}
+    index = _load_index(base_dir)
+    file_count = sum(1 for p in base_dir.glob("*.json") if p.name != _INDEX_NAME)
+    if len(index) != file_count:
+        index = _rebuild_index(base_dir)
+    return index
+
+
 def save_submission(base_dir: Path, payload: Dict[str, Any]) -> Path:
     """
     Speichert eine Abgabe als einzelne JSON-Datei.
@@ -31,17 +116,61 @@ def save_submission(base_dir: Path, payload: Dict[str, Any]) -> Path:
     path = base_dir / fname
 
     payload["submitted_at"] = datetime.now(tz=BERLIN).isoformat(timespec="seconds")
-    path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+    # Precompute the Historie grouping key once at write time
+    payload["game_key"] = (
+        f"{game.get('date', 'unknown')}__{game.get('home', 'unknown')}__{game.get('away', 'unknown')}"
+    )
+    path.write_text(_dumps(payload, indent=_PRETTY), encoding="utf-8")
+
+    index = _load_index(base_dir)
+    index[fname] = _index_row(payload, fname)
+    _write_index(base_dir, index)
+
     return path
 
 
 def list_submissions(base_dir: Path) -> List[Path]:
     if not base_dir.exists():
         return []
-    return sorted(base_dir.glob("*.json"), reverse=True)
+    return sorted(
+        (p for p in base_dir.glob("*.json") if p.name != _INDEX_NAME),
+        reverse=True,
+    )
+
+
+def export_submissions_parquet(base_dir: Path, out_path: Path) -> int:
+    """Batch-export all submissions into one flat Parquet file.
+
+    Meant for offline Historie analytics (mean ratings per opponent etc.)
+    where per-file JSON loops do not scale; the Parquet file can be read
+    directly by pandas or DuckDB. Nested game/ratings/notes dicts are
+    flattened to dotted columns. Returns the number of exported rows.
+
+    Requires a Parquet engine (pyarrow or fastparquet) to be installed.
+    """
+    import pandas as pd
+
+    rows = []
+    for path in base_dir.glob("*.json"):
+        if path.name == _INDEX_NAME:
+            continue
+        try:
+            payload = load_json(path)
+        except Exception:
+            continue
+        if payload:
+            payload["_filename"] = path.name
+            rows.append(payload)
+
+    if not rows:
+        return 0
+
+    df = pd.json_normalize(rows, max_level=2)
+    df.to_parquet(out_path, compression="snappy")
+    return len(df)
 
 
 def load_json(path: Path) -> Optional[Dict[str, Any]]:
     if not path.exists():
         return None
-    return json.loads(path.read_text(encoding="utf-8"))
+    return _loads(path.read_bytes())